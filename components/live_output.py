@@ -1,27 +1,24 @@
 import os
 import logging
-import json
 from typing import Dict, Optional
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMenu, QAction,
     QSizePolicy
 )
-from PyQt5.QtCore import Qt, QPropertyAnimation
+from PyQt5.QtCore import Qt, QPropertyAnimation, QTimer
 from PyQt5.QtGui import QFont, QPixmap
 from components.media_player import MediaPlayer
+from components.styles import CONTROL_QSS, CONTENT_LABEL_DEFAULT_QSS, content_label_qss, set_qss
+from core import json_io
+from models.theme_model import DEFAULT_THEME
 from PyQt5.QtMultimediaWidgets import QVideoWidget
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data/logs/sanctify.log'),
-        logging.StreamHandler()
-    ]
-)
+# Handlers are configured once by the application entry point
 logger = logging.getLogger(__name__)
 
+# Video extensions, compared against the lowercased extension only
+_VIDEO_EXTS = frozenset({".mp4", ".avi", ".mov"})
+
 class LiveOutput(QWidget):
     def __init__(self, parent=None, settings_manager=None, main_window=None):
         super().__init__(parent)
@@ -33,6 +30,18 @@ class LiveOutput(QWidget):
         self.current_type = "text"
         self.zoom_level = 1.0
 
+        # Rapid zoom steps collapse into a single re-render on the next event-loop tick
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(0)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+
+        # Fade animations are built once and restarted on each content change
+        self._fade_anim = QPropertyAnimation(self, b"windowOpacity", self)
+        self._fade_anim.setDuration(300)
+        self._fade_anim.setStartValue(0.8)
+        self._fade_anim.setEndValue(1.0)
+
         # Enable drag-and-drop
         self.setAcceptDrops(True)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -46,20 +55,18 @@ class LiveOutput(QWidget):
         self.content_label.setAlignment(Qt.AlignCenter)
         self.content_label.setWordWrap(True)
         self.content_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.content_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                color: #ecf0f1;
-                background-color: #2c3e50;
-                border: 2px solid #34495e;
-                border-radius: 6px;
-                padding: 20px;
-            }
-        """)
+        set_qss(self.content_label, CONTENT_LABEL_DEFAULT_QSS)
         self.layout.addWidget(self.content_label)
+        self._text_anim = QPropertyAnimation(self.content_label, b"windowOpacity", self)
+        self._text_anim.setDuration(500)
+        self._text_anim.setStartValue(0.0)
+        self._text_anim.setEndValue(1.0)
 
         # Control buttons
-        control_layout = QHBoxLayout()
+        controls = QWidget()
+        set_qss(controls, CONTROL_QSS)
+        control_layout = QHBoxLayout(controls)
+        control_layout.setContentsMargins(0, 0, 0, 0)
         self.fullscreen_button = QPushButton("Full Screen")
         self.fullscreen_button.setToolTip("Toggle full-screen mode")
         self.fullscreen_button.clicked.connect(self.toggle_fullscreen)
@@ -74,28 +81,30 @@ class LiveOutput(QWidget):
         self.zoom_out_button.clicked.connect(self.zoom_out)
 
         for btn in [self.fullscreen_button, self.clear_button, self.zoom_in_button, self.zoom_out_button]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    border: 2px solid #3498db;
-                    border-radius: 6px;
-                    background: #3498db;
-                    color: #fff;
-                    transition: background 0.3s;
-                }
-                QPushButton:hover {
-                    background: #2980b9;
-                }
-            """)
             control_layout.addWidget(btn)
         control_layout.addStretch()
-        self.layout.addLayout(control_layout)
+        self.layout.addWidget(controls)
 
-        # Context menu
+        # Context menu, built once and reused on every right-click
+        self._context_menu = QMenu(self)
+        for label, callback in [
+            ("Clear", self.set_blank),
+            ("Toggle Full Screen", self.toggle_fullscreen),
+            ("Zoom In", self.zoom_in),
+            ("Zoom Out", self.zoom_out)
+        ]:
+            action = QAction(label, self)
+            action.triggered.connect(callback)
+            self._context_menu.addAction(action)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
+        # Cache hot-path settings and keep them in sync with the settings manager
+        self._anim_enabled = False
+        if self.settings_manager:
+            self._anim_enabled = bool(self.settings_manager.get_setting("appearance", "enable_animations"))
+            self.settings_manager.settings_changed.connect(self._on_setting_changed)
+
         # Apply initial theme
         self.apply_theme()
 
@@ -112,34 +121,34 @@ class LiveOutput(QWidget):
         font.fromString(self.settings_manager.get_setting("appearance", "ui_font"))
         bg_color = "#2c3e50" if theme == "Light" else "#ecf0f1"
         text_color = "#ecf0f1" if theme == "Light" else "#2c3e50"
-        self.content_label.setStyleSheet(f"""
-            QLabel {{
-                font-family: {font.family()};
-                font-size: {int(font.pointSize() * self.zoom_level)}pt;
-                color: {text_color};
-                background-color: {bg_color};
-                border: 2px solid #34495e;
-                border-radius: 6px;
-                padding: 20px;
-            }}
-        """)
-        logger.debug(f"Applied live output theme: {theme}")
+        self._apply_label_qss(font.family(), font.pointSize(), text_color, bg_color)
+        logger.debug("Applied live output theme: %s", theme)
+
+    def _on_setting_changed(self, section: str, key: str, value):
+        """Refresh cached settings when the settings manager reports a change."""
+        if section == "appearance" and key == "enable_animations":
+            self._anim_enabled = bool(value)
+
+    def _apply_label_qss(self, font_family: str, font_size: float, font_color: str, bg_color: str):
+        """Set the content label stylesheet for the font size at the current zoom level."""
+        set_qss(self.content_label, content_label_qss(font_family, int(font_size * self.zoom_level), font_color, bg_color))
+
+    def _show_content_label(self):
+        """Stop and hide the media player, if any, and show the text label."""
+        if self.media_player is not None and not self.media_player.isHidden():
+            if self.media_player.media_player is not None:
+                self.media_player.media_player.stop()
+            self.media_player.hide()
+        self.content_label.show()
 
     def setText(self, text: str, style: Dict[str, str]):
         """Set text content with style."""
-        if self.media_player:
-            self.layout.removeWidget(self.media_player)
-            self.media_player.deleteLater()
-            self.media_player = None
-            self.layout.addWidget(self.content_label)
+        self._show_content_label()
 
         self.current_content = text
         self.current_style = style
         self.current_type = "text"
 
-        font = QFont(style.get("font_family", "Arial"))
-        font.setPointSize(int(float(style.get("font_size", 18)) * self.zoom_level))
-        self.content_label.setFont(font)
         self.content_label.setText(text)
         alignment = {
             "left": Qt.AlignLeft,
@@ -147,57 +156,45 @@ class LiveOutput(QWidget):
             "right": Qt.AlignRight
         }.get(style.get("alignment", "center").lower(), Qt.AlignCenter)
         self.content_label.setAlignment(alignment)
-        self.content_label.setStyleSheet(f"""
-            QLabel {{
-                font-family: {style.get("font_family", "Arial")};
-                font-size: {int(float(style.get("font_size", 18)) * self.zoom_level)}pt;
-                color: {style.get("font_color", "#ecf0f1")};
-                background-color: {style.get("background_color", "#2c3e50")};
-                border: 2px solid #34495e;
-                border-radius: 6px;
-                padding: 20px;
-            }}
-        """)
+        self._apply_label_qss(
+            style.get("font_family", "Arial"),
+            float(style.get("font_size", 18)),
+            style.get("font_color", "#ecf0f1"),
+            style.get("background_color", "#2c3e50")
+        )
 
         # Animate content change
-        if self.settings_manager and self.settings_manager.get_setting("appearance", "enable_animations"):
-            anim = QPropertyAnimation(self.content_label, b"windowOpacity")
-            anim.setDuration(500)
-            anim.setStartValue(0.0)
-            anim.setEndValue(1.0)
-            anim.start()
+        if self._anim_enabled:
+            self._text_anim.stop()
+            self._text_anim.start()
 
         self.main_window.status_bar.showMessage("Live text updated")
-        logger.info(f"Live output set: text={text[:50]}...")
+        logger.info("Live output set: text=%s...", text[:50])
 
     def setMedia(self, file_path: str):
         """Set media content (image or video)."""
         if not os.path.exists(file_path):
             self.main_window.status_bar.showMessage(f"Media file not found: {file_path}")
-            logger.error(f"Media file not found: {file_path}")
+            logger.error("Media file not found: %s", file_path)
             return
 
-        if self.media_player:
-            self.layout.removeWidget(self.media_player)
-            self.media_player.deleteLater()
-        self.layout.removeWidget(self.content_label)
-        self.media_player = MediaPlayer(parent=self, settings_manager=self.settings_manager, main_window=self.main_window)
-        self.layout.addWidget(self.media_player)
+        if self.media_player is None:
+            # Created once on first use and reused for every later media change
+            self.media_player = MediaPlayer(parent=self, settings_manager=self.settings_manager, main_window=self.main_window)
+            self.layout.insertWidget(self.layout.indexOf(self.content_label) + 1, self.media_player)
+        self.content_label.hide()
+        self.media_player.show()
         self.media_player.setMedia(file_path)
         self.media_player.play()
 
         self.current_content = file_path
-        self.current_type = "video" if file_path.lower().endswith((".mp4", ".avi", ".mov")) else "image"
+        self.current_type = "video" if os.path.splitext(file_path)[1].lower() in _VIDEO_EXTS else "image"
         self.main_window.status_bar.showMessage(f"Live media: {os.path.basename(file_path)}")
-        logger.info(f"Live output set: media={file_path}, type={self.current_type}")
+        logger.info("Live output set: media=%s, type=%s", file_path, self.current_type)
 
     def set_blank(self):
         """Clear the live output."""
-        if self.media_player:
-            self.layout.removeWidget(self.media_player)
-            self.media_player.deleteLater()
-            self.media_player = None
-            self.layout.addWidget(self.content_label)
+        self._show_content_label()
         self.content_label.setText("")
         self.zoom_level = 1.0
         self.apply_theme()
@@ -214,42 +211,33 @@ class LiveOutput(QWidget):
             self.showFullScreen()
             self.fullscreen_button.setText("Exit Full Screen")
             self.main_window.status_bar.showMessage("Entered full-screen mode")
-        logger.info(f"Live output full-screen: {self.isFullScreen()}")
+        logger.info("Live output full-screen: %s", self.isFullScreen())
 
-    def zoom_in(self):
-        """Increase zoom level."""
-        self.zoom_level = min(self.zoom_level + 0.1, 2.0)
+    def _apply_zoom(self):
+        """Re-render the current content once for all zoom steps queued since the last tick."""
         if self.current_type == "text":
             self.setText(self.current_content, self.current_style)
-        elif self.current_type in ["image", "video"] and self.media_player:
+        elif self.current_type == "image" and self.media_player:
             self.media_player.setMedia(self.current_content)
         self.main_window.status_bar.showMessage(f"Zoom: {int(self.zoom_level * 100)}%")
-        logger.info(f"Zoom in: level={self.zoom_level}")
+
+    def zoom_in(self):
+        """Increase zoom level."""
+        self.zoom_level = min(self.zoom_level + 0.1, 2.0)
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+        logger.info("Zoom in: level=%s", self.zoom_level)
 
     def zoom_out(self):
         """Decrease zoom level."""
         self.zoom_level = max(self.zoom_level - 0.1, 0.5)
-        if self.current_type == "text":
-            self.setText(self.current_content, self.current_style)
-        elif self.current_type in ["image", "video"] and self.media_player:
-            self.media_player.setMedia(self.current_content)
-        self.main_window.status_bar.showMessage(f"Zoom: {int(self.zoom_level * 100)}%")
-        logger.info(f"Zoom out: level={self.zoom_level}")
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+        logger.info("Zoom out: level=%s", self.zoom_level)
 
     def show_context_menu(self, pos):
         """Show context menu for live output."""
-        menu = QMenu()
-        actions = [
-            ("Clear", self.set_blank),
-            ("Toggle Full Screen", self.toggle_fullscreen),
-            ("Zoom In", self.zoom_in),
-            ("Zoom Out", self.zoom_out)
-        ]
-        for label, callback in actions:
-            action = QAction(label, self)
-            action.triggered.connect(callback)
-            menu.addAction(action)
-        menu.exec_(self.mapToGlobal(pos))
+        self._context_menu.exec_(self.mapToGlobal(pos))
 
     def dragEnterEvent(self, event):
         """Handle drag enter for content drop."""
@@ -261,20 +249,15 @@ class LiveOutput(QWidget):
         """Handle drop of content from tabs."""
         mime_data = event.mimeData()
         if mime_data.hasFormat("application/x-sanctify-item"):
-            data = json.loads(mime_data.data("application/x-sanctify-item").data().decode())
-            theme = self.main_window.themes_tab.theme_model.get_theme_by_id(
-                self.main_window.themes_tab.theme_list.currentItem().data(Qt.UserRole)
-            ) if self.main_window.themes_tab.theme_list.currentItem() else {
-                "font_color": "#ecf0f1", "background_color": "#2c3e50",
-                "font_size": "18", "font_family": "Arial", "alignment": "center"
-            }
+            data = json_io.loads(bytes(mime_data.data("application/x-sanctify-item")))
+            theme = self.main_window.themes_tab.current_theme or DEFAULT_THEME
             content = None
             content_type = "text"
             if data["type"] == "song":
                 content = self.main_window.songs_tab.song_model.get_song_by_id(data["id"]).get("lyrics", "No lyrics")
             elif data["type"] == "media":
                 content = self.main_window.media_tab.media_model.get_media_by_id(data["id"]).get("file_path", "")
-                content_type = "video" if content.lower().endswith((".mp4", ".avi", ".mov")) else "image"
+                content_type = "video" if os.path.splitext(content)[1].lower() in _VIDEO_EXTS else "image"
             elif data["type"] == "presentation":
                 content = self.main_window.presentation_tab.presentation_model.get_presentation_by_id(data["id"]).get("slides", ["No slides"])[0]
             if content:
@@ -283,7 +266,7 @@ class LiveOutput(QWidget):
                 else:
                     self.setMedia(content)
                 self.main_window.status_bar.showMessage(f"Dropped {data['type']} to live output")
-                logger.info(f"Dropped {data['type']} to live output: id={data['id']}")
+                logger.info("Dropped %s to live output: id=%s", data["type"], data["id"])
             event.accept()
         else:
             event.ignore()
@@ -291,9 +274,6 @@ class LiveOutput(QWidget):
     def update(self):
         """Force update with animation."""
         super().update()
-        if self.settings_manager and self.settings_manager.get_setting("appearance", "enable_animations"):
-            anim = QPropertyAnimation(self, b"windowOpacity")
-            anim.setDuration(300)
-            anim.setStartValue(0.8)
-            anim.setEndValue(1.0)
-            anim.start()
\ No newline at end of file
+        if self._anim_enabled:
+            self._fade_anim.stop()
+            self._fade_anim.start()
\ No newline at end of file
@@ -1,36 +1,87 @@
 import os
 import logging
-from typing import Optional
+from typing import Dict, Optional
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QSlider, QLabel, QFileDialog, QMenu, QAction, QSizePolicy
 )
 from PyQt5.QtMultimediaWidgets import QVideoWidget
-import json
-from PyQt5.QtCore import QSize, pyqtSignal
+from core import json_io
+from components.styles import CONTROL_QSS, SLIDER_QSS, set_qss
+from PyQt5.QtCore import QSize, pyqtSignal, QObject, QRunnable, QThreadPool
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 from PyQt5.QtCore import Qt, QUrl, QPropertyAnimation
-from PyQt5.QtGui import QPixmap, QImage
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data/logs/sanctify.log'),
-        logging.StreamHandler()
-    ]
-)
+from PyQt5.QtGui import QPixmap, QImage, QPixmapCache
+
+# Handlers are configured once by the application entry point
 logger = logging.getLogger(__name__)
 
+# Supported media extensions, compared against the lowercased extension only
+_VIDEO_EXTS = frozenset({".mp4", ".avi", ".mov"})
+_IMAGE_EXTS = frozenset({".jpg", ".png", ".bmp"})
+_MEDIA_EXTS = _VIDEO_EXTS | _IMAGE_EXTS
+
+# Scaled copies of the current image kept around for resizes
+_SCALED_CACHE_MAX = 8
+
+# Interval of playback position notifications from the backend, which also paces seek slider repaints
+_POSITION_NOTIFY_MS = 250
+
+_VIDEO_WIDGET_QSS = """
+    QVideoWidget {
+        background-color: #2c3e50;
+        border: 2px solid #34495e;
+        border-radius: 6px;
+    }
+"""
+
+_IMAGE_LABEL_QSS = """
+    QLabel {
+        background-color: #2c3e50;
+        border: 2px solid #34495e;
+        border-radius: 6px;
+        padding: 10px;
+    }
+"""
+
+class _ImageLoaderSignals(QObject):
+    loaded = pyqtSignal(int, str, str, QImage)  # token, file_path, cache_key, image
+
+class _ImageLoader(QRunnable):
+    """Decode an image file on a pool thread and hand the QImage back to the GUI thread."""
+
+    def __init__(self, token: int, file_path: str, cache_key: str):
+        super().__init__()
+        self.token = token
+        self.file_path = file_path
+        self.cache_key = cache_key
+        # Owned by the runnable rather than the player, so a decode that outlives its player emits into nothing
+        self.signals = _ImageLoaderSignals()
+
+    def run(self):
+        self.signals.loaded.emit(self.token, self.file_path, self.cache_key, QImage(self.file_path))
+
 class MediaPlayer(QWidget):
     def __init__(self, parent=None, settings_manager=None, main_window=None):
         super().__init__(parent)
         self.settings_manager = settings_manager
         self.main_window = main_window
-        self.media_player = QMediaPlayer(None, QMediaPlayer.VideoSurface)
+        # The multimedia backend and video surface are created on the first video load
+        self.media_player: Optional[QMediaPlayer] = None
+        self.video_widget: Optional[QVideoWidget] = None
         self.current_media = None
         self.is_image = False
         self.loop_enabled = False
+        self._full_pixmap: Optional[QPixmap] = None
+        self._scaled_cache: Dict[tuple, QPixmap] = {}
+        # Images are decoded off the GUI thread; the token drops results for media replaced in the meantime
+        self._load_token = 0
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 65536))  # KB
+
+        # Fade animation is built once and restarted on each update
+        self._fade_anim = QPropertyAnimation(self, b"windowOpacity", self)
+        self._fade_anim.setDuration(300)
+        self._fade_anim.setStartValue(0.8)
+        self._fade_anim.setEndValue(1.0)
 
         # Enable drag-and-drop
         self.setAcceptDrops(True)
@@ -40,33 +91,22 @@ class MediaPlayer(QWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(10, 10, 10, 10)
 
-        # Content area (video or image)
-        self.video_widget = QVideoWidget()
-        self.video_widget.setStyleSheet("""
-            QVideoWidget {
-                background-color: #2c3e50;
-                border: 2px solid #34495e;
-                border-radius: 6px;
-            }
-        """)
-        self.media_player.setVideoOutput(self.video_widget)
+        # Content area (video widget is inserted ahead of the image label by _ensure_video)
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignCenter)
         self.image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #2c3e50;
-                border: 2px solid #34495e;
-                border-radius: 6px;
-                padding: 10px;
-            }
-        """)
-        self.layout.addWidget(self.video_widget)
-        self.video_widget.hide()  # Hidden until video is loaded
+        # Keep the scaled pixmap from raising the label's minimum size, which would grow the window on every resize
+        self.image_label.setMinimumSize(1, 1)
+        set_qss(self.image_label, _IMAGE_LABEL_QSS)
+        self._image_label_qss = _IMAGE_LABEL_QSS
+        self.layout.addWidget(self.image_label)
         self.image_label.hide()   # Hidden until image is loaded
 
         # Control panel
-        control_layout = QHBoxLayout()
+        controls = QWidget()
+        set_qss(controls, CONTROL_QSS + SLIDER_QSS)
+        control_layout = QHBoxLayout(controls)
+        control_layout.setContentsMargins(0, 0, 0, 0)
         self.play_button = QPushButton("Play")
         self.play_button.setToolTip("Play or pause the media")
         self.play_button.clicked.connect(self.toggle_play_pause)
@@ -89,51 +129,6 @@ class MediaPlayer(QWidget):
         self.seek_slider.setToolTip("Seek through media")
         self.seek_slider.sliderMoved.connect(self.set_position)
 
-        for btn in [self.play_button, self.stop_button, self.load_button, self.loop_button]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    border: 2px solid #3498db;
-                    border-radius: 6px;
-                    background: #3498db;
-                    color: #fff;
-                    transition: background 0.3s;
-                }
-                QPushButton:hover {
-                    background: #2980b9;
-                }
-            """)
-        self.volume_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                height: 8px;
-                background: #ecf0f1;
-                border: 1px solid #34495e;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #3498db;
-                border: 1px solid #34495e;
-                width: 16px;
-                margin: -4px 0;
-                border-radius: 8px;
-            }
-        """)
-        self.seek_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                height: 8px;
-                background: #ecf0f1;
-                border: 1px solid #34495e;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #3498db;
-                border: 1px solid #34495e;
-                width: 16px;
-                margin: -4px 0;
-                border-radius: 8px;
-            }
-        """)
         control_layout.addWidget(self.play_button)
         control_layout.addWidget(self.stop_button)
         control_layout.addWidget(self.load_button)
@@ -143,20 +138,36 @@ class MediaPlayer(QWidget):
         control_layout.addWidget(QLabel("Seek:"))
         control_layout.addWidget(self.seek_slider)
         control_layout.addStretch()
-        self.layout.addLayout(control_layout)
-
-        # Media player signals
-        self.media_player.positionChanged.connect(self.update_position)
-        self.media_player.durationChanged.connect(self.update_duration)
-        self.media_player.stateChanged.connect(self.update_buttons)
-        self.media_player.mediaStatusChanged.connect(self.handle_media_status)
+        self.layout.addWidget(controls)
 
-        # Context menu
+        # Context menu, built once and reused on every right-click
+        self._context_menu = QMenu(self)
+        self._play_pause_action = QAction("Play/Pause", self)
+        self._play_pause_action.triggered.connect(self.toggle_play_pause)
+        self._context_menu.addAction(self._play_pause_action)
+        for label, callback in [
+            ("Stop", self.stop),
+            ("Load Media", self.load_media),
+            ("Toggle Loop", self.toggle_loop)
+        ]:
+            action = QAction(label, self)
+            action.triggered.connect(callback)
+            self._context_menu.addAction(action)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
-        # Apply initial settings
+        # Track the selected theme for the image background
+        themes_tab = getattr(self.main_window, "themes_tab", None)
+        if themes_tab is not None:
+            self.on_theme_changed(themes_tab.current_theme)
+            themes_tab.theme_changed.connect(self.on_theme_changed)
+
+        # Apply initial settings and keep the cached values in sync with the settings manager
+        self._anim_enabled = False
+        self.playback_speed = 1.0
         self.apply_settings()
+        if self.settings_manager:
+            self.settings_manager.settings_changed.connect(self._on_setting_changed)
 
     def apply_settings(self):
         """Apply settings from settings_manager."""
@@ -164,64 +175,154 @@ class MediaPlayer(QWidget):
             return
         self.loop_enabled = self.settings_manager.get_setting("behavior", "loop_media", False)
         self.loop_button.setText("Loop On" if self.loop_enabled else "Loop Off")
-        playback_speed = self.settings_manager.get_setting("behavior", "default_playback_speed", 1.0)
-        self.media_player.setPlaybackRate(playback_speed)
-        logger.debug(f"Applied settings: loop={self.loop_enabled}, playback_speed={playback_speed}")
+        self.playback_speed = self.settings_manager.get_setting("behavior", "default_playback_speed", 1.0)
+        if self.media_player is not None:
+            self.media_player.setPlaybackRate(self.playback_speed)
+        self._anim_enabled = bool(self.settings_manager.get_setting("appearance", "enable_animations"))
+        logger.debug("Applied settings: loop=%s, playback_speed=%s", self.loop_enabled, self.playback_speed)
+
+    def _on_setting_changed(self, section: str, key: str, value):
+        """Refresh cached settings when the settings manager reports a change."""
+        if section == "behavior" and key == "loop_media":
+            self.loop_enabled = bool(value)
+            self.loop_button.setText("Loop On" if self.loop_enabled else "Loop Off")
+        elif section == "behavior" and key == "default_playback_speed":
+            self.playback_speed = value
+            if self.media_player is not None:
+                self.media_player.setPlaybackRate(value)
+        elif section == "appearance" and key == "enable_animations":
+            self._anim_enabled = bool(value)
+
+    def _ensure_video(self):
+        """Create the QMediaPlayer and video widget on first use and wire their signals."""
+        if self.media_player is not None:
+            return
+        self.media_player = QMediaPlayer(None, QMediaPlayer.VideoSurface)
+        self.video_widget = QVideoWidget()
+        set_qss(self.video_widget, _VIDEO_WIDGET_QSS)
+        self.media_player.setVideoOutput(self.video_widget)
+        self.layout.insertWidget(self.layout.indexOf(self.image_label), self.video_widget)
+        self.video_widget.hide()
+        self.media_player.setNotifyInterval(_POSITION_NOTIFY_MS)
+        self.media_player.setPlaybackRate(self.playback_speed)
+        self.media_player.setVolume(self.volume_slider.value())
+        self.media_player.positionChanged.connect(self.update_position)
+        self.media_player.durationChanged.connect(self.update_duration)
+        self.media_player.stateChanged.connect(self.update_buttons)
+        self.media_player.mediaStatusChanged.connect(self.handle_media_status)
+        logger.debug("Created video backend")
+
+    def on_theme_changed(self, theme: Optional[dict]):
+        """Rebuild the image background stylesheet for the newly selected theme."""
+        background = (theme or {}).get("background_color", "#2c3e50")
+        self._image_label_qss = f"""
+            QLabel {{
+                background-color: {background};
+                border: 2px solid #34495e;
+                border-radius: 6px;
+                padding: 10px;
+            }}
+        """
+        if self.is_image and not self.image_label.isHidden():
+            set_qss(self.image_label, self._image_label_qss)
+
+    def _show_full_pixmap(self, pixmap: QPixmap):
+        """Display a decoded full-resolution image scaled to the label."""
+        self._full_pixmap = pixmap
+        self.image_label.setPixmap(self._scaled_pixmap(self.image_label.contentsRect().size()))
+        set_qss(self.image_label, self._image_label_qss)
+
+    def _on_image_loaded(self, token: int, file_path: str, cache_key: str, image: QImage):
+        """Receive a decoded image from the thread pool."""
+        if token != self._load_token:
+            return
+        if image.isNull():
+            self.image_label.setText("Invalid image")
+            logger.error("Invalid image: %s", file_path)
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
+        self._show_full_pixmap(pixmap)
+
+    def _scaled_pixmap(self, size: QSize) -> QPixmap:
+        """Return the current image scaled to size, starting from the smallest cached copy that covers it."""
+        key = (size.width(), size.height())
+        pixmap = self._scaled_cache.get(key)
+        if pixmap is None:
+            target = self._full_pixmap.size().scaled(size, Qt.KeepAspectRatio)
+            source = self._full_pixmap
+            for cached in self._scaled_cache.values():
+                if (cached.width() >= target.width() and cached.height() >= target.height()
+                        and cached.width() < source.width()):
+                    source = cached
+            pixmap = source.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if len(self._scaled_cache) >= _SCALED_CACHE_MAX:
+                self._scaled_cache.pop(next(iter(self._scaled_cache)))
+            self._scaled_cache[key] = pixmap
+        return pixmap
 
     def setMedia(self, file_path: str):
         """Set media file to play."""
-        if not os.path.exists(file_path):
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
             self.main_window.status_bar.showMessage(f"Media file not found: {file_path}")
-            logger.error(f"Media file not found: {file_path}")
+            logger.error("Media file not found: %s", file_path)
             return
 
+        if file_path == self.current_media:
+            # Same media again: rescale a shown image, leave a loaded video (and its position) alone
+            if self.is_image and self._full_pixmap is not None:
+                self.image_label.setPixmap(self._scaled_pixmap(self.image_label.contentsRect().size()))
+                return
+            if not self.is_image and self.media_player is not None:
+                return
+
         self.current_media = file_path
-        self.is_image = file_path.lower().endswith((".jpg", ".png", ".bmp"))
-        
+        self.is_image = os.path.splitext(file_path)[1].lower() in _IMAGE_EXTS
+        self._load_token += 1
+        self._full_pixmap = None
+        self._scaled_cache = {}
+
         if self.is_image:
-            self.video_widget.hide()
+            if self.video_widget is not None:
+                self.video_widget.hide()
             self.image_label.show()
-            pixmap = QPixmap(file_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(self.image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.image_label.setPixmap(scaled_pixmap)
-                # Apply theme for image background
-                theme = self.main_window.themes_tab.theme_model.get_theme_by_id(
-                    self.main_window.themes_tab.theme_list.currentItem().data(Qt.UserRole)
-                ) if self.main_window.themes_tab.theme_list.currentItem() else {
-                    "background_color": "#2c3e50"
-                }
-                self.image_label.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: {theme.get("background_color", "#2c3e50")};
-                        border: 2px solid #34495e;
-                        border-radius: 6px;
-                        padding: 10px;
-                    }}
-                """)
+            cache_key = f"{file_path}|{mtime}"
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is not None and not pixmap.isNull():
+                self._show_full_pixmap(pixmap)
             else:
-                self.image_label.setText("Invalid image")
-                logger.error(f"Invalid image: {file_path}")
+                loader = _ImageLoader(self._load_token, file_path, cache_key)
+                loader.signals.loaded.connect(self._on_image_loaded)
+                QThreadPool.globalInstance().start(loader)
         else:
+            self._ensure_video()
             self.image_label.hide()
             self.video_widget.show()
             self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(file_path)))
         
-        logger.info(f"Set media: {file_path}, type={'image' if self.is_image else 'video'}")
+        logger.info("Set media: %s, type=%s", file_path, "image" if self.is_image else "video")
+
+    def resizeEvent(self, event):
+        """Rescale the displayed image to the new label size."""
+        super().resizeEvent(event)
+        if self.is_image and self._full_pixmap is not None:
+            self.image_label.setPixmap(self._scaled_pixmap(self.image_label.contentsRect().size()))
 
     def play(self):
         """Play the media."""
         if self.is_image:
             self.image_label.show()
             self.main_window.status_bar.showMessage(f"Displaying image: {os.path.basename(self.current_media)}")
-        else:
+        elif self.media_player is not None:
             self.media_player.play()
             self.main_window.status_bar.showMessage(f"Playing video: {os.path.basename(self.current_media)}")
-        logger.info(f"Playing media: {self.current_media}")
+        logger.info("Playing media: %s", self.current_media)
 
     def toggle_play_pause(self):
         """Toggle play/pause state."""
-        if self.is_image:
+        if self.is_image or self.media_player is None:
             return
         if self.media_player.state() == QMediaPlayer.PlayingState:
             self.media_player.pause()
@@ -230,14 +331,16 @@ class MediaPlayer(QWidget):
         else:
             self.media_player.play()
             self.main_window.status_bar.showMessage(f"Playing: {os.path.basename(self.current_media)}")
-            logger.info(f"Media playing: {self.current_media}")
+            logger.info("Media playing: %s", self.current_media)
 
     def stop(self):
         """Stop the media."""
-        self.media_player.stop()
+        if self.media_player is not None:
+            self.media_player.stop()
         if self.is_image:
             self.image_label.hide()
-            self.video_widget.show()
+            if self.video_widget is not None:
+                self.video_widget.show()
         self.main_window.status_bar.showMessage("Media stopped")
         logger.info("Media stopped")
 
@@ -257,32 +360,35 @@ class MediaPlayer(QWidget):
         """Toggle looping state."""
         self.loop_enabled = not self.loop_enabled
         self.loop_button.setText("Loop On" if self.loop_enabled else "Loop Off")
-        self.media_player.setNotifyInterval(1000 if self.loop_enabled else 0)
         if self.settings_manager:
             self.settings_manager.set_setting("behavior", "loop_media", self.loop_enabled)
         self.main_window.status_bar.showMessage(f"Loop {'enabled' if self.loop_enabled else 'disabled'}")
-        logger.info(f"Loop {'enabled' if self.loop_enabled else 'disabled'}")
+        logger.info("Loop %s", "enabled" if self.loop_enabled else "disabled")
 
     def set_volume(self, value: int):
         """Set media volume."""
-        self.media_player.setVolume(value)
+        if self.media_player is not None:
+            self.media_player.setVolume(value)
         self.main_window.status_bar.showMessage(f"Volume: {value}%")
-        logger.info(f"Set volume: {value}%")
+        logger.info("Set volume: %s%%", value)
 
     def set_position(self, position: int):
         """Set media position."""
+        if self.media_player is None:
+            return
         self.media_player.setPosition(position)
-        logger.debug(f"Set position: {position}ms")
+        logger.debug("Set position: %sms", position)
 
     def update_position(self, position: int):
-        """Update seek slider position."""
-        self.seek_slider.setValue(position)
-        logger.debug(f"Position updated: {position}ms")
+        """Move the seek slider to the playback position, unless the user is dragging it."""
+        if not self.seek_slider.isSliderDown():
+            self.seek_slider.setValue(position)
+        logger.debug("Position updated: %sms", position)
 
     def update_duration(self, duration: int):
         """Update seek slider range."""
         self.seek_slider.setRange(0, duration)
-        logger.debug(f"Duration set: {duration}ms")
+        logger.debug("Duration set: %sms", duration)
 
     def handle_media_status(self, status: QMediaPlayer.MediaStatus):
         """Handle media status changes."""
@@ -295,7 +401,7 @@ class MediaPlayer(QWidget):
             logger.error("Invalid media file loaded")
         elif status == QMediaPlayer.LoadedMedia:
             self.main_window.status_bar.showMessage(f"Loaded: {os.path.basename(self.current_media)}")
-            logger.info(f"Media loaded: {self.current_media}")
+            logger.info("Media loaded: %s", self.current_media)
 
     def update_buttons(self, state: QMediaPlayer.State):
         """Update play/pause button text."""
@@ -307,19 +413,8 @@ class MediaPlayer(QWidget):
 
     def show_context_menu(self, pos):
         """Show context menu for media player."""
-        menu = QMenu()
-        actions = [
-            ("Play/Pause", self.toggle_play_pause, not self.is_image),
-            ("Stop", self.stop, True),
-            ("Load Media", self.load_media, True),
-            ("Toggle Loop", self.toggle_loop, True)
-        ]
-        for label, callback, enabled in actions:
-            action = QAction(label, self)
-            action.triggered.connect(callback)
-            action.setEnabled(enabled)
-            menu.addAction(action)
-        menu.exec_(self.mapToGlobal(pos))
+        self._play_pause_action.setEnabled(not self.is_image)
+        self._context_menu.exec_(self.mapToGlobal(pos))
 
     def dragEnterEvent(self, event):
         """Handle drag enter for media drop."""
@@ -330,22 +425,22 @@ class MediaPlayer(QWidget):
     def dropEvent(self, event):
         """Handle drop of media from tabs or file system."""
         if event.mimeData().hasFormat("application/x-sanctify-item"):
-            data = json.loads(event.mimeData().data("application/x-sanctify-item").data().decode())
+            data = json_io.loads(bytes(event.mimeData().data("application/x-sanctify-item")))
             if data["type"] == "media":
                 file_path = self.main_window.media_tab.media_model.get_media_by_id(data["id"]).get("file_path", "")
                 if file_path:
                     self.setMedia(file_path)
                     self.play()
                     self.main_window.status_bar.showMessage(f"Dropped media: {os.path.basename(file_path)}")
-                    logger.info(f"Dropped media: {file_path}")
+                    logger.info("Dropped media: %s", file_path)
             event.accept()
         elif event.mimeData().hasUrls():
             url = event.mimeData().urls()[0].toLocalFile()
-            if url.lower().endswith((".mp4", ".avi", ".mov", ".jpg", ".png", ".bmp")):
+            if os.path.splitext(url)[1].lower() in _MEDIA_EXTS:
                 self.setMedia(url)
                 self.play()
                 self.main_window.status_bar.showMessage(f"Dropped file: {os.path.basename(url)}")
-                logger.info(f"Dropped file: {url}")
+                logger.info("Dropped file: %s", url)
             event.accept()
         else:
             event.ignore()
@@ -353,9 +448,6 @@ class MediaPlayer(QWidget):
     def update(self):
         """Force update with animation."""
         super().update()
-        if self.settings_manager and self.settings_manager.get_setting("appearance", "enable_animations"):
-            anim = QPropertyAnimation(self, b"windowOpacity")
-            anim.setDuration(300)
-            anim.setStartValue(0.8)
-            anim.setEndValue(1.0)
-            anim.start()
\ No newline at end of file
+        if self._anim_enabled:
+            self._fade_anim.stop()
+            self._fade_anim.start()
\ No newline at end of file
@@ -5,23 +5,20 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMenu, QAction,
     QSizePolicy
 )
-from PyQt5.QtCore import Qt, QPropertyAnimation, QMimeData
+from PyQt5.QtCore import Qt, QPropertyAnimation, QMimeData, QTimer
 from PyQt5.QtGui import QFont, QPixmap
 from components.media_player import MediaPlayer
+from components.styles import CONTROL_QSS, CONTENT_LABEL_DEFAULT_QSS, content_label_qss, set_qss
 from PyQt5.QtMultimediaWidgets import QVideoWidget
-import json
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data/logs/sanctify.log'),
-        logging.StreamHandler()
-    ]
-)
+from core import json_io
+from models.theme_model import DEFAULT_THEME
+
+# Handlers are configured once by the application entry point
 logger = logging.getLogger(__name__)
 
+# Video extensions recognised by the preview, compared against the lowercased extension only
+_MEDIA_VIDEO_EXTS = frozenset({".mp4", ".avi"})
+
 class PreviewCanvas(QWidget):
     def __init__(self, parent=None, settings_manager=None, main_window=None):
         super().__init__(parent)
@@ -31,6 +28,21 @@ class PreviewCanvas(QWidget):
         self.current_style = {}
         self.zoom_level = 1.0
         self.media_player = None
+        # (content, type) of the last shown content; the fade only plays when it changes
+        self._last_content_hash = None
+
+        # Refresh requests are coalesced into one rebuild on the next event-loop tick
+        self._pending_status = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        # Fade-in animation, built once and restarted on each content change
+        self._opacity_anim = QPropertyAnimation(self, b"windowOpacity", self)
+        self._opacity_anim.setDuration(500)
+        self._opacity_anim.setStartValue(0.0)
+        self._opacity_anim.setEndValue(1.0)
 
         # Enable drag-and-drop
         self.setAcceptDrops(True)
@@ -45,20 +57,14 @@ class PreviewCanvas(QWidget):
         self.content_label.setAlignment(Qt.AlignCenter)
         self.content_label.setWordWrap(True)
         self.content_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.content_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                color: #ecf0f1;
-                background-color: #2c3e50;
-                border: 2px solid #34495e;
-                border-radius: 6px;
-                padding: 20px;
-            }
-        """)
+        set_qss(self.content_label, CONTENT_LABEL_DEFAULT_QSS)
         self.layout.addWidget(self.content_label)
 
-        # Control buttons
-        control_layout = QHBoxLayout()
+        # Control buttons (the container carries the stylesheet, since the main window styles this widget itself)
+        controls = QWidget()
+        set_qss(controls, CONTROL_QSS)
+        control_layout = QHBoxLayout(controls)
+        control_layout.setContentsMargins(0, 0, 0, 0)
         self.refresh_button = QPushButton("Refresh")
         self.refresh_button.setToolTip("Refresh the preview content")
         self.refresh_button.clicked.connect(self.refresh_preview)
@@ -73,28 +79,34 @@ class PreviewCanvas(QWidget):
         self.clear_button.clicked.connect(self.clear_preview)
 
         for btn in [self.refresh_button, self.zoom_in_button, self.zoom_out_button, self.clear_button]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    border: 2px solid #3498db;
-                    border-radius: 6px;
-                    background: #3498db;
-                    color: #fff;
-                    transition: background 0.3s;
-                }
-                QPushButton:hover {
-                    background: #2980b9;
-                }
-            """)
             control_layout.addWidget(btn)
         control_layout.addStretch()
-        self.layout.addLayout(control_layout)
+        self.layout.addWidget(controls)
 
-        # Context menu
+        # Context menu, built once and reused on every right-click
+        self._ctx_menu = QMenu(self)
+        for label, callback in [
+            ("Refresh", self.refresh_preview),
+            ("Clear", self.clear_preview),
+            ("Zoom In", self.zoom_in),
+            ("Zoom Out", self.zoom_out)
+        ]:
+            action = QAction(label, self)
+            action.triggered.connect(callback)
+            self._ctx_menu.addAction(action)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
+        # Cache the appearance settings used on every refresh and keep them in sync
+        self._anim_enabled = False
+        self._theme = None
+        self._ui_font = QFont()
+        if self.settings_manager:
+            self._anim_enabled = bool(self.settings_manager.get_setting("appearance", "enable_animations"))
+            self._theme = self.settings_manager.get_setting("appearance", "theme")
+            self._ui_font.fromString(self.settings_manager.get_setting("appearance", "ui_font"))
+            self.settings_manager.settings_changed.connect(self._on_setting_changed)
+
         # Apply initial theme
         self.apply_theme()
 
@@ -102,24 +114,29 @@ class PreviewCanvas(QWidget):
         """Apply theme and font from settings."""
         if not self.settings_manager:
             return
-        theme = self.settings_manager.get_setting("appearance", "theme")
-        font = QFont()
-        font.fromString(self.settings_manager.get_setting("appearance", "ui_font"))
+        theme = self._theme
+        font = self._ui_font
         bg_color = "#2c3e50" if theme == "Light" else "#ecf0f1"
         text_color = "#ecf0f1" if theme == "Light" else "#2c3e50"
-        self.content_label.setStyleSheet(f"""
-            QLabel {{
-                font-family: {font.family()};
-                font-size: {int(font.pointSize() * self.zoom_level)}pt;
-                color: {text_color};
-                background-color: {bg_color};
-                border: 2px solid #34495e;
-                border-radius: 6px;
-                padding: 20px;
-            }}
-        """)
+        self._apply_label_qss(font.family(), int(font.pointSize() * self.zoom_level), text_color, bg_color)
         logger.debug(f"Applied preview canvas theme: {theme}")
 
+    def _on_setting_changed(self, section: str, key: str, value):
+        """Refresh cached appearance settings when the settings manager reports a change."""
+        if section != "appearance":
+            return
+        if key == "enable_animations":
+            self._anim_enabled = bool(value)
+        elif key == "theme":
+            self._theme = value
+        elif key == "ui_font":
+            self._ui_font = QFont()
+            self._ui_font.fromString(value)
+
+    def _apply_label_qss(self, font_family: str, pt: int, fg: str, bg: str):
+        """Set the content label stylesheet, skipping the Qt CSS parse when it is unchanged."""
+        set_qss(self.content_label, content_label_qss(font_family, pt, fg, bg))
+
     def set_content(self, content: str, style: Dict[str, str], content_type: str = "text"):
         """Set preview content with style."""
         if self.media_player:
@@ -143,17 +160,12 @@ class PreviewCanvas(QWidget):
                 "right": Qt.AlignRight
             }.get(style.get("alignment", "center").lower(), Qt.AlignCenter)
             self.content_label.setAlignment(alignment)
-            self.content_label.setStyleSheet(f"""
-                QLabel {{
-                    font-family: {style.get("font_family", "Arial")};
-                    font-size: {int(float(style.get("font_size", 18)) * self.zoom_level)}pt;
-                    color: {style.get("font_color", "#ecf0f1")};
-                    background-color: {style.get("background_color", "#2c3e50")};
-                    border: 2px solid #34495e;
-                    border-radius: 6px;
-                    padding: 20px;
-                }}
-            """)
+            self._apply_label_qss(
+                style.get("font_family", "Arial"),
+                int(float(style.get("font_size", 18)) * self.zoom_level),
+                style.get("font_color", "#ecf0f1"),
+                style.get("background_color", "#2c3e50")
+            )
         elif content_type in ["image", "video"]:
             self.layout.removeWidget(self.content_label)
             self.media_player = MediaPlayer()
@@ -167,17 +179,24 @@ class PreviewCanvas(QWidget):
                 logger.error(f"Media file not found: {content}")
         
         # Animate content change
-        if self.settings_manager.get_setting("appearance", "enable_animations"):
-            anim = QPropertyAnimation(self, b"windowOpacity")
-            anim.setDuration(500)
-            anim.setStartValue(0.0)
-            anim.setEndValue(1.0)
-            anim.start()
+        content_hash = hash((content, content_type))
+        if self._anim_enabled and content_hash != self._last_content_hash:
+            self._opacity_anim.stop()
+            self._opacity_anim.start()
+        self._last_content_hash = content_hash
 
         logger.info(f"Preview set: type={content_type}, content={content[:50]}...")
         self.update()
 
+    def _current_theme(self) -> Dict[str, str]:
+        """Return the selected theme as resolved by the themes tab, or the default style."""
+        return self.main_window.themes_tab.current_theme or DEFAULT_THEME
+
     def refresh_preview(self):
+        """Schedule a preview refresh; repeated requests before it runs collapse into one."""
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
         """Refresh preview based on current tab selection."""
         if not self.main_window:
             self.content_label.setText("No content selected")
@@ -185,27 +204,22 @@ class PreviewCanvas(QWidget):
             return
 
         current_tab = self.main_window.tabs.currentWidget()
-        theme = self.main_window.themes_tab.theme_model.get_theme_by_id(
-            self.main_window.themes_tab.theme_list.currentItem().data(Qt.UserRole)
-        ) if self.main_window.themes_tab.theme_list.currentItem() else {
-            "font_color": "#ecf0f1", "background_color": "#2c3e50",
-            "font_size": "18", "font_family": "Arial", "alignment": "center"
-        }
+        theme = self._current_theme()
 
         content = None
         content_type = "text"
-        if isinstance(current_tab, self.main_window.songs_tab.__class__):
+        if current_tab is self.main_window.songs_tab:
             item = current_tab.song_list.currentItem()
             if item:
                 content = item.data(Qt.UserRole).get("lyrics", "No lyrics available")
-        elif isinstance(current_tab, self.main_window.scriptures_tab.__class__):
+        elif current_tab is self.main_window.scriptures_tab:
             content = "Scripture content (implementation pending)"
-        elif isinstance(current_tab, self.main_window.media_tab.__class__):
+        elif current_tab is self.main_window.media_tab:
             item = current_tab.media_list.currentItem()
             if item:
                 content = item.data(Qt.UserRole).get("file_path", "")
-                content_type = "video" if content.lower().endswith((".mp4", ".avi")) else "image"
-        elif isinstance(current_tab, self.main_window.presentation_tab.__class__):
+                content_type = "video" if os.path.splitext(content)[1].lower() in _MEDIA_VIDEO_EXTS else "image"
+        elif current_tab is self.main_window.presentation_tab:
             item = current_tab.presentation_list.currentItem()
             if item:
                 content = item.data(Qt.UserRole).get("slides", ["No slides available"])[0]
@@ -216,20 +230,25 @@ class PreviewCanvas(QWidget):
         else:
             self.set_content("No content selected", theme, "text")
             self.main_window.status_bar.showMessage("No content selected")
+        if self._pending_status:
+            self.main_window.status_bar.showMessage(self._pending_status)
+            self._pending_status = None
         logger.info(f"Refreshed preview: type={content_type}")
 
     def zoom_in(self):
         """Increase zoom level."""
         self.zoom_level = min(self.zoom_level + 0.1, 2.0)
+        self._pending_status = f"Zoom: {int(self.zoom_level * 100)}%"
+        self.main_window.status_bar.showMessage(self._pending_status)
         self.refresh_preview()
-        self.main_window.status_bar.showMessage(f"Zoom: {int(self.zoom_level * 100)}%")
         logger.info(f"Zoom in: level={self.zoom_level}")
 
     def zoom_out(self):
         """Decrease zoom level."""
         self.zoom_level = max(self.zoom_level - 0.1, 0.5)
+        self._pending_status = f"Zoom: {int(self.zoom_level * 100)}%"
+        self.main_window.status_bar.showMessage(self._pending_status)
         self.refresh_preview()
-        self.main_window.status_bar.showMessage(f"Zoom: {int(self.zoom_level * 100)}%")
         logger.info(f"Zoom out: level={self.zoom_level}")
 
     def clear_preview(self):
@@ -247,18 +266,7 @@ class PreviewCanvas(QWidget):
 
     def show_context_menu(self, pos):
         """Show context menu for preview canvas."""
-        menu = QMenu()
-        actions = [
-            ("Refresh", self.refresh_preview),
-            ("Clear", self.clear_preview),
-            ("Zoom In", self.zoom_in),
-            ("Zoom Out", self.zoom_out)
-        ]
-        for label, callback in actions:
-            action = QAction(label, self)
-            action.triggered.connect(callback)
-            menu.addAction(action)
-        menu.exec_(self.mapToGlobal(pos))
+        self._ctx_menu.exec_(self.mapToGlobal(pos))
 
     def dragEnterEvent(self, event):
         """Handle drag enter for content drop."""
@@ -270,20 +278,15 @@ class PreviewCanvas(QWidget):
         """Handle drop of content from tabs."""
         mime_data = event.mimeData()
         if mime_data.hasFormat("application/x-sanctify-item"):
-            data = json.loads(mime_data.data("application/x-sanctify-item").data().decode())
-            theme = self.main_window.themes_tab.theme_model.get_theme_by_id(
-                self.main_window.themes_tab.theme_list.currentItem().data(Qt.UserRole)
-            ) if self.main_window.themes_tab.theme_list.currentItem() else {
-                "font_color": "#ecf0f1", "background_color": "#2c3e50",
-                "font_size": "18", "font_family": "Arial", "alignment": "center"
-            }
+            data = json_io.loads(bytes(mime_data.data("application/x-sanctify-item")))
+            theme = self._current_theme()
             content = None
             content_type = "text"
             if data["type"] == "song":
                 content = self.main_window.songs_tab.song_model.get_song_by_id(data["id"]).get("lyrics", "No lyrics")
             elif data["type"] == "media":
                 content = self.main_window.media_tab.media_model.get_media_by_id(data["id"]).get("file_path", "")
-                content_type = "video" if content.lower().endswith((".mp4", ".avi")) else "image"
+                content_type = "video" if os.path.splitext(content)[1].lower() in _MEDIA_VIDEO_EXTS else "image"
             elif data["type"] == "presentation":
                 content = self.main_window.presentation_tab.presentation_model.get_presentation_by_id(data["id"]).get("slides", ["No slides"])[0]
             if content:
@@ -293,13 +296,3 @@ class PreviewCanvas(QWidget):
             event.accept()
         else:
             event.ignore()
-
-    def update(self):
-        """Force update of widget."""
-        super().update()
-        if self.settings_manager.get_setting("appearance", "enable_animations"):
-            anim = QPropertyAnimation(self, b"windowOpacity")
-            anim.setDuration(300)
-            anim.setStartValue(0.8)
-            anim.setEndValue(1.0)
-            anim.start()
\ No newline at end of file
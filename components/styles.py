@@ -0,0 +1,73 @@
+from functools import lru_cache
+from PyQt5.QtWidgets import QWidget
+
+# Control button stylesheet, set once on the container that holds the buttons
+CONTROL_QSS = """
+    QPushButton {
+        padding: 8px 16px;
+        font-size: 14px;
+        border: 2px solid #3498db;
+        border-radius: 6px;
+        background: #3498db;
+        color: #fff;
+        transition: background 0.3s;
+    }
+    QPushButton:hover {
+        background: #2980b9;
+    }
+"""
+
+# Slider rules appended to CONTROL_QSS by containers that also hold sliders
+SLIDER_QSS = """
+    QSlider::groove:horizontal {
+        height: 8px;
+        background: #ecf0f1;
+        border: 1px solid #34495e;
+        border-radius: 4px;
+    }
+    QSlider::handle:horizontal {
+        background: #3498db;
+        border: 1px solid #34495e;
+        width: 16px;
+        margin: -4px 0;
+        border-radius: 8px;
+    }
+"""
+
+# Content label style before any theme or content has been applied
+CONTENT_LABEL_DEFAULT_QSS = """
+    QLabel {
+        font-size: 18px;
+        color: #ecf0f1;
+        background-color: #2c3e50;
+        border: 2px solid #34495e;
+        border-radius: 6px;
+        padding: 20px;
+    }
+"""
+
+# Content labels are styled through QSS, not QPalette/setFont: the main window's application-wide
+# stylesheet sets QWidget colors and fonts, and stylesheet rules take precedence over a palette
+_CONTENT_LABEL_QSS_TPL = """
+    QLabel {{
+        font-family: {ff};
+        font-size: {pt}pt;
+        color: {fg};
+        background-color: {bg};
+        border: 2px solid #34495e;
+        border-radius: 6px;
+        padding: 20px;
+    }}
+"""
+
+@lru_cache(maxsize=128)
+def content_label_qss(font_family: str, pt: int, fg: str, bg: str) -> str:
+    """Return the content label stylesheet for a font/color combination, formatted once per combination."""
+    return _CONTENT_LABEL_QSS_TPL.format(ff=font_family, pt=pt, fg=fg, bg=bg)
+
+def set_qss(widget: QWidget, qss: str):
+    """Apply a stylesheet only if it differs from the one last applied to the widget."""
+    if getattr(widget, "_last_qss", None) == qss:
+        return
+    widget.setStyleSheet(qss)
+    widget._last_qss = qss
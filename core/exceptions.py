@@ -9,4 +9,4 @@ class SanctifyError(Exception):
         self.error_code = error_code
         self.message = f"[{module}] {error_code}: {message}"
         super().__init__(self.message)
-        logger.error(self.message, exc_info=True)
\ No newline at end of file
+        logger.error(self.message)
\ No newline at end of file
@@ -0,0 +1,22 @@
+import os
+from typing import Dict
+from core import json_io
+
+def file_signature(file_path: str) -> list:
+    """Return [size, mtime_ns] for a file, the key startup caches compare to skip re-reading it."""
+    st = os.stat(file_path)
+    return [st.st_size, st.st_mtime_ns]
+
+def load_cache(cache_file: str) -> Dict:
+    """Read a JSON cache file, treating a missing or unreadable cache as empty."""
+    try:
+        cache = json_io.load_file(cache_file)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def write_cache(cache_file: str, cache: Dict) -> None:
+    """Write a JSON cache file compactly, creating its directory if needed; raises OSError on failure."""
+    os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+    with open(cache_file, 'wb') as f:
+        f.write(json_io.dumps(cache, indent=False))
@@ -0,0 +1,28 @@
+import json
+from typing import Any, Union
+
+# orjson is optional; without it the stdlib json module is used with the same call signatures
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both orjson.JSONDecodeError and the stdlib error are subclasses of this
+JSONDecodeError = json.JSONDecodeError
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse JSON from bytes or str without decoding bytes first."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, pretty-printed unless indent is False."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=4 if indent else None, ensure_ascii=False).encode('utf-8')
+
+def load_file(path: str) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
@@ -0,0 +1,38 @@
+import os
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+
+LOG_FILE = 'data/logs/sanctify.log'
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_configured = False
+
+def configure_logging(level: int = logging.INFO, log_file: str = LOG_FILE) -> None:
+    """Configure root logging once for the whole application; later calls are no-ops.
+
+    Records are queued on the calling thread and written to the file and console by a
+    background listener, so logging never blocks the GUI thread on disk I/O.
+    """
+    global _configured
+    if _configured:
+        return
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(log_file)]
+    # Console output only helps an interactive terminal; redirected or detached launches skip it
+    if sys.stderr is not None and sys.stderr.isatty():
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Stopping the listener drains the queue, so records logged during shutdown are kept
+    atexit.register(listener.stop)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _configured = True
@@ -1,22 +1,41 @@
 import os
-import json
+import copy
 import logging
 from typing import Dict, Any
-from PyQt5.QtCore import QObject, pyqtSignal
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 from core.exceptions import SanctifyError
+from core import json_io
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data/logs/sanctify.log'),
-        logging.StreamHandler()
-    ]
-)
+# Handlers are configured once by the application entry point
 logger = logging.getLogger(__name__)
 
+# QFont("Arial", 12).toString(), spelled out so defaults never touch the Qt font database
+DEFAULT_UI_FONT = "Arial,12,-1,5,50,0,0,0,0,0"
+
+# Distinguishes a missing key from a stored None in get_setting
+_MISSING = object()
+
+_STARTUP_SCREENS = frozenset({"Songs", "Scriptures", "Media", "Presentations", "Themes"})
+_LANGUAGES = frozenset({"English", "Spanish", "French", "German"})
+_THEMES = frozenset({"Light", "Dark"})
+
+# Per-key validators, looked up by (section, key); a falsy result resets the value to its default
+_VALIDATORS = {
+    ("general", "startup_screen"): lambda v: v in _STARTUP_SCREENS,
+    ("general", "language"): lambda v: v in _LANGUAGES,
+    ("appearance", "theme"): lambda v: v in _THEMES,
+    ("behavior", "auto_save_interval"): lambda v: isinstance(v, int) and 60 <= v <= 3600,
+    ("behavior", "default_playback_speed"): lambda v: isinstance(v, float) and 0.5 <= v <= 2.0,
+}
+
+# Path settings that point at files; every other path key is a directory
+_FILE_PATH_KEYS = frozenset({"songs", "media_metadata", "presentations", "themes"})
+
+# Validators applied to every key of a section without a per-key entry
+_SECTION_VALIDATORS = {
+    "paths": lambda v: isinstance(v, str),
+}
+
 class SettingsManager(QObject):
     """Manage application-wide settings stored in a JSON file with change signals."""
     settings_changed = pyqtSignal(str, str, object)  # section, key, value
@@ -33,7 +52,7 @@ class SettingsManager(QObject):
             },
             "appearance": {
                 "theme": "Light",
-                "ui_font": QFont("Arial", 12).toString(),
+                "ui_font": DEFAULT_UI_FONT,
                 "enable_animations": True
             },
             "paths": {
@@ -59,6 +78,16 @@ class SettingsManager(QObject):
         }
         self.settings: Dict[str, Any] = {}
         self.restart_required = False
+        # set_setting marks the settings dirty and the timer writes them once things go quiet
+        self._dirty = False
+        # Hash of the last payload written, so unchanged settings are not rewritten
+        self._last_payload_hash = None
+        # Paths already confirmed to exist this session; only hits are cached, since files may still be created later
+        self._known_paths = set()
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._flush_save)
         try:
             self._ensure_directories()
             self.load_settings()
@@ -79,15 +108,14 @@ class SettingsManager(QObject):
         """Load settings from JSON file, falling back to defaults if needed."""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                    self.settings = self._merge_settings(self.default_settings, loaded_settings)
-                    self._validate_settings()
+                loaded_settings = json_io.load_file(self.config_file)
+                self.settings = self._merge_settings(self.default_settings, loaded_settings)
+                self._validate_settings()
             else:
                 self.settings = self.default_settings.copy()
                 self._save_settings()
             logger.info("Settings loaded successfully")
-        except json.JSONDecodeError as e:
+        except json_io.JSONDecodeError as e:
             logger.error(f"Corrupted settings file {self.config_file}: {e}")
             self.settings = self.default_settings.copy()
             self._save_settings()
@@ -95,63 +123,90 @@ class SettingsManager(QObject):
             raise SanctifyError("SettingsManager", "LOAD_001", f"Error loading settings from {self.config_file}: {e}")
 
     def _merge_settings(self, defaults: Dict, loaded: Dict) -> Dict:
-        """Recursively merge loaded settings with defaults."""
-        result = defaults.copy()
-        for key, value in loaded.items():
-            if key in result and isinstance(value, dict) and isinstance(result[key], dict):
-                result[key] = self._merge_settings(result[key], value)
-            else:
-                result[key] = value
+        """Merge loaded settings over defaults, section by section."""
+        result = {section: dict(values) if isinstance(values, dict) else values for section, values in defaults.items()}
+        for section, values in loaded.items():
+            bucket = result.get(section)
+            if not isinstance(values, dict) or not isinstance(bucket, dict):
+                result[section] = values
+                continue
+            for key, value in values.items():
+                default_value = bucket.get(key)
+                # One level deeper only for dict-valued settings such as general.window_geometry
+                if isinstance(value, dict) and isinstance(default_value, dict):
+                    bucket[key] = {**default_value, **value}
+                else:
+                    bucket[key] = value
         return result
 
     def _save_settings(self) -> None:
         """Save settings to JSON file."""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4, ensure_ascii=False)
+            payload = json_io.dumps(self.settings)
+            payload_hash = hash(payload)
+            if payload_hash == self._last_payload_hash and os.path.exists(self.config_file):
+                self._dirty = False
+                return
+            tmp_file = f"{self.config_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.config_file)
+            self._last_payload_hash = payload_hash
+            self._dirty = False
             logger.info("Settings saved successfully")
         except Exception as e:
             raise SanctifyError("SettingsManager", "SAVE_001", f"Error saving settings to {self.config_file}: {e}")
 
+    def _schedule_save(self) -> None:
+        """Mark settings dirty and (re)start the debounced save."""
+        self._dirty = True
+        self._save_timer.start()
+
+    def _flush_save(self) -> None:
+        """Write settings if anything changed since the last save."""
+        if not self._dirty:
+            return
+        # Runs from the timer and the quit hook, where an escaping exception would abort the app
+        try:
+            self._save_settings()
+        except SanctifyError:
+            logger.error("Deferred settings save failed, keeping changes for the next save")
+
+    def flush(self) -> None:
+        """Write any pending settings changes immediately, e.g. on shutdown; failures are logged."""
+        self._save_timer.stop()
+        self._flush_save()
+
     def _validate_settings(self) -> None:
         """Validate settings values and log warnings for invalid ones."""
         try:
-            for section, keys in self.settings.items():
-                for key, value in keys.items():
-                    if section == "general":
-                        if key == "startup_screen" and value not in ["Songs", "Scriptures", "Media", "Presentations", "Themes"]:
-                            logger.warning(f"Invalid startup_screen: {value}, resetting to default")
-                            self.settings[section][key] = self.default_settings[section][key]
-                        elif key == "language" and value not in ["English", "Spanish", "French", "German"]:
-                            logger.warning(f"Invalid language: {value}, resetting to default")
-                            self.settings[section][key] = self.default_settings[section][key]
-                    elif section == "appearance":
-                        if key == "theme" and value not in ["Light", "Dark"]:
-                            logger.warning(f"Invalid theme: {value}, resetting to default")
-                            self.settings[section][key] = self.default_settings[section][key]
-                    elif section == "behavior":
-                        if key == "auto_save_interval" and (not isinstance(value, int) or value < 60 or value > 3600):
-                            logger.warning(f"Invalid auto_save_interval: {value}, resetting to default")
-                            self.settings[section][key] = self.default_settings[section][key]
-                        elif key == "default_playback_speed" and (not isinstance(value, float) or value < 0.5 or value > 2.0):
-                            logger.warning(f"Invalid default_playback_speed: {value}, resetting to default")
-                            self.settings[section][key] = self.default_settings[section][key]
-                    elif section == "paths":
-                        if not isinstance(value, str):
-                            logger.warning(f"Invalid path type for {key}: {type(value)}, resetting to default")
-                            self.settings[section][key] = self.default_settings[section][key]
-            self._save_settings()
+            # Walk the rules rather than every stored key, so keys without a rule cost nothing
+            invalid = []
+            for (section, key), validator in _VALIDATORS.items():
+                values = self.settings.get(section)
+                if isinstance(values, dict) and key in values and not validator(values[key]):
+                    invalid.append((section, key))
+            for section, validator in _SECTION_VALIDATORS.items():
+                values = self.settings.get(section)
+                if isinstance(values, dict):
+                    invalid.extend((section, key) for key, value in values.items() if not validator(value))
+            for section, key in invalid:
+                logger.warning(f"Invalid {section}.{key}: {self.settings[section][key]!r}, resetting to default")
+                self.settings[section][key] = self.default_settings[section][key]
+            if invalid:
+                self._save_settings()
         except Exception as e:
             raise SanctifyError("SettingsManager", "VALIDATE_001", f"Error validating settings: {e}")
 
     def get_setting(self, section: str, key: str, default: Any = None) -> Any:
         """Get a setting value from a section."""
-        try:
-            return self.settings[section][key]
-        except KeyError:
-            return default if default is not None else self.default_settings.get(section, {}).get(key)
-        except Exception as e:
-            raise SanctifyError("SettingsManager", "GET_001", f"Error retrieving setting {section}.{key}: {e}")
+        values = self.settings.get(section)
+        # A corrupted, non-dict section falls back to the default like a missing one
+        if isinstance(values, dict):
+            value = values.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        return default if default is not None else self.default_settings.get(section, {}).get(key)
 
     def set_setting(self, section: str, key: str, value: Any) -> bool:
         """Set a setting value and save."""
@@ -159,7 +214,7 @@ class SettingsManager(QObject):
             if section not in self.settings:
                 self.settings[section] = {}
             self.settings[section][key] = value
-            self._save_settings()
+            self._schedule_save()
             self.settings_changed.emit(section, key, value)
             logger.info(f"Set {section}.{key} = {value}")
 
@@ -168,7 +223,6 @@ class SettingsManager(QObject):
             elif section == "advanced" and key == "developer_mode":
                 logging.getLogger().setLevel(logging.DEBUG if value else logging.INFO)
                 self.settings["advanced"]["log_level"] = "DEBUG" if value else "INFO"
-                self._save_settings()
             return True
         except Exception as e:
             raise SanctifyError("SettingsManager", "SET_001", f"Failed to set setting {section}.{key}: {e}")
@@ -189,8 +243,8 @@ class SettingsManager(QObject):
     def export_settings(self, file_path: str) -> bool:
         """Export settings to a JSON file."""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4, ensure_ascii=False)
+            with open(file_path, 'wb') as f:
+                f.write(json_io.dumps(self.settings))
             logger.info(f"Settings exported to {file_path}")
             return True
         except Exception as e:
@@ -199,8 +253,7 @@ class SettingsManager(QObject):
     def import_settings(self, file_path: str) -> bool:
         """Import settings from a JSON file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                imported_settings = json.load(f)
+            imported_settings = json_io.load_file(file_path)
             self.settings = self._merge_settings(self.default_settings, imported_settings)
             self._validate_settings()
             self._save_settings()
@@ -210,7 +263,7 @@ class SettingsManager(QObject):
                 for key, value in keys.items():
                     self.settings_changed.emit(section, key, value)
             return True
-        except json.JSONDecodeError as e:
+        except json_io.JSONDecodeError as e:
             raise SanctifyError("SettingsManager", "IMPORT_001", f"Corrupted JSON in {file_path}: {e}")
         except Exception as e:
             raise SanctifyError("SettingsManager", "IMPORT_002", f"Error importing settings from {file_path}: {e}")
@@ -218,28 +271,49 @@ class SettingsManager(QObject):
     def validate_paths(self) -> Dict[str, bool]:
         """Validate configured paths."""
         try:
-            paths = self.get_setting("paths", {}, self.default_settings["paths"])
+            paths = self.settings.get("paths", self.default_settings["paths"])
             results = {}
             for key, path in paths.items():
                 try:
                     if not isinstance(path, str):
                         raise SanctifyError("SettingsManager", f"PATH_TYPE_{key.upper()}", f"Invalid path type for {key}: {type(path)}, expected string")
-                    if key in ["songs", "media_metadata", "presentations", "themes"]:
+                    if key in _FILE_PATH_KEYS:
                         results[key] = os.path.isfile(path) and os.access(path, os.R_OK)
                     else:
                         results[key] = os.path.isdir(path) and os.access(path, os.R_OK)
-                    if not results[key]:
-                        logger.warning(f"Invalid path for {key}: {path}")
+                    if results[key]:
+                        self.mark_path_exists(path)
                 except SanctifyError as e:
                     results[key] = False
                     raise e
                 except Exception as e:
                     results[key] = False
                     raise SanctifyError("SettingsManager", f"PATH_VALIDATE_{key.upper()}", f"Error validating path {key} = {path}: {e}")
+            invalid = [key for key, valid in results.items() if not valid]
+            if invalid:
+                logger.warning("Invalid paths in settings: %s", ", ".join(f"{key} = {paths[key]}" for key in invalid))
             return results
         except Exception as e:
             raise SanctifyError("SettingsManager", "PATH_VALIDATE_001", f"Error validating paths: {e}")
 
+    def config_path(self, file_name: str) -> str:
+        """Return the path of a file kept next to the settings file, such as a startup cache."""
+        return os.path.join(os.path.dirname(self.config_file), file_name)
+
+    def mark_path_exists(self, path: str) -> None:
+        """Record that a path exists, so later path_exists calls skip the filesystem."""
+        self._known_paths.add(os.path.normpath(path))
+
+    def path_exists(self, path: str) -> bool:
+        """Check whether a path exists, consulting paths already confirmed this session first."""
+        key = os.path.normpath(path)
+        if key in self._known_paths:
+            return True
+        if os.path.exists(path):
+            self._known_paths.add(key)
+            return True
+        return False
+
     def is_restart_required(self) -> bool:
         """Check if a restart is required."""
         return self.restart_required
@@ -258,7 +332,7 @@ class SettingsManager(QObject):
             SanctifyError: If retrieval fails.
         """
         try:
-            return json.loads(json.dumps(self.settings))  # Deep copy to avoid mutation
+            return copy.deepcopy(self.settings)  # Deep copy to avoid mutation
         except Exception as e:
             raise SanctifyError("SettingsManager", "GET_ALL_001", f"Failed to retrieve all settings: {e}")
         
\ No newline at end of file
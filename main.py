@@ -1,6 +1,5 @@
 import sys
 import os
-import json
 import logging
 import uuid
 from datetime import datetime
@@ -14,74 +13,61 @@ temp_logger.addHandler(temp_handler)
 temp_logger.setLevel(logging.INFO)
 
 try:
-    temp_logger.info("Starting import of standard libraries")
-    import sys
-    temp_logger.info("Imported sys")
-    import os
-    temp_logger.info("Imported os")
-    import json
-    temp_logger.info("Imported json")
-    import uuid
-    temp_logger.info("Imported uuid")
-    from datetime import datetime
-    temp_logger.info("Imported datetime")
-    from typing import Dict
-    temp_logger.info("Imported typing.Dict")
-except Exception as e:
-    temp_logger.error("Failed to import standard libraries: %s", e)
-    raise
-
-try:
-    temp_logger.info("Starting import of PyQt5 modules")
     from PyQt5.QtWidgets import QApplication, QSplashScreen, QProgressBar, QMessageBox
-    temp_logger.info("Imported PyQt5.QtWidgets")
-    from PyQt5.QtGui import QPixmap, QFont, QIcon
-    temp_logger.info("Imported PyQt5.QtGui")
+    from PyQt5.QtGui import QPixmap
     from PyQt5.QtCore import Qt, QTimer, QCoreApplication, QTranslator, QPropertyAnimation
-    temp_logger.info("Imported PyQt5.QtCore")
 except Exception as e:
     temp_logger.error("Failed to import PyQt5 modules: %s", e)
     raise
 
 try:
-    temp_logger.info("Starting import of custom modules")
-    from ui.main_window import SanctifyApp
-    temp_logger.info("Imported ui.main_window.SanctifyApp")
-    from core.settings_manager import SettingsManager
-    temp_logger.info("Imported core.settings_manager.SettingsManager")
+    from core.settings_manager import SettingsManager, DEFAULT_UI_FONT
     from core.exceptions import SanctifyError
-    temp_logger.info("Imported core.exceptions.SanctifyError")
-    from models.song_model import SongModel
-    temp_logger.info("Imported models.song_model.SongModel")
-    from models.media_model import MediaModel
-    temp_logger.info("Imported models.media_model.MediaModel")
-    from models.presentation_model import PresentationModel
-    temp_logger.info("Imported models.presentation_model.PresentationModel")
-    from models.theme_model import ThemeModel
-    temp_logger.info("Imported models.theme_model.ThemeModel")
-    from models.scripture_model import ScriptureModel
-    temp_logger.info("Imported models.scripture_model.ScriptureModel")
+    from core.logging_setup import configure_logging
+    from core import json_io
+    from core.file_cache import file_signature, load_cache, write_cache
 except Exception as e:
     temp_logger.error("Failed to import custom modules: %s", e)
     raise
+temp_logger.debug("PyQt and core modules loaded")
 
 # Setup main logging
 try:
-    temp_logger.info("Setting up main logging")
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('data/logs/sanctify.log'),
-            logging.StreamHandler()
-        ]
-    )
+    temp_logger.debug("Setting up main logging")
+    configure_logging()
     logger = logging.getLogger(__name__)
     logger.info("Main logging setup complete")
 except Exception as e:
     temp_logger.error("Failed to setup main logging: %s", e)
     raise SanctifyError("Main", "LOG_001", f"Failed to setup logging: {e}")
 
+# Splash and progress bar styles; the bar is a child of the splash, so one stylesheet covers both
+SPLASH_QSS = """
+    QSplashScreen {
+        background: #2c3e50;
+        border: 2px solid #3498db;
+    }
+    QProgressBar {
+        border: 1px solid #3498db;
+        border-radius: 3px;
+        background: #ecf0f1;
+        text-align: center;
+        color: #2c3e50;
+    }
+    QProgressBar::chunk {
+        background: #3498db;
+    }
+"""
+
+# Directories created or confirmed this session, including their parents
+_ensured_dirs = set()
+
+def _mark_ensured(directory: str) -> None:
+    """Record a directory and all of its parents as existing."""
+    while directory and directory not in _ensured_dirs:
+        _ensured_dirs.add(directory)
+        directory = os.path.dirname(directory)
+
 def ensure_directories():
     """Ensure required directories exist."""
     directories = [
@@ -96,17 +82,36 @@ def ensure_directories():
         'data/bibles',
         'assets/translations'
     ]
-    for directory in directories:
+    # makedirs creates parents, so only the deepest directories need a call
+    unique = sorted(set(directories))
+    leaves = [d for d in unique if not any(o.startswith(d + '/') for o in unique)]
+    for directory in leaves:
         try:
-            logger.info(f"Checking directory: {directory}")
+            logger.info("Checking directory: %s", directory)
             os.makedirs(directory, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {directory}")
+            _mark_ensured(directory)
+            logger.debug("Ensured directory exists: %s", directory)
         except Exception as e:
-            logger.error(f"Failed to create directory {directory}: %s", e)
+            logger.error("Failed to create directory %s: %s", directory, e)
             raise SanctifyError("Main", "DIR_001", f"Failed to create directory {directory}: {e}")
     logger.info("All directories ensured")
     return True
 
+# File names per directory, read once per session with a single scandir
+_dir_listings: Dict[str, frozenset] = {}
+
+def _dir_listing(directory: str) -> frozenset:
+    """Return the names in a directory, or an empty set if it cannot be read."""
+    names = _dir_listings.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as entries:
+                names = frozenset(entry.name for entry in entries)
+        except OSError:
+            names = frozenset()
+        _dir_listings[directory] = names
+    return names
+
 def validate_assets():
     """Validate required assets exist."""
     assets = [
@@ -119,162 +124,216 @@ def validate_assets():
         'assets/icons/white.png',
         'assets/icons/live.png'
     ]
-    missing = []
-    for asset in assets:
-        try:
-            logger.info(f"Checking asset: {asset}")
-            if not os.path.exists(asset):
-                logger.warning(f"Missing asset: {asset}")
-                missing.append(asset)
-            else:
-                logger.debug(f"Asset exists: {asset}")
-        except Exception as e:
-            logger.error(f"Error checking asset {asset}: %s", e)
-            raise SanctifyError("Main", "ASSET_001", f"Error checking asset {asset}: {e}")
+    try:
+        missing = [asset for asset in assets
+                   if os.path.basename(asset) not in _dir_listing(os.path.dirname(asset))]
+    except Exception as e:
+        logger.error("Error checking assets: %s", e)
+        raise SanctifyError("Main", "ASSET_001", f"Error checking assets: {e}")
     logger.info("Asset validation complete")
     return missing
 
+# Sample content for data files, built only when a file has to be created or restored.
+# Static samples are stored pre-serialized; only their timestamp placeholder is filled in.
+_TIMESTAMP_PLACEHOLDER = b"__NOW__"
+
+_SAMPLE_SONGS_JSON = b"""[
+    {
+        "title": "Amazing Grace",
+        "sections": [
+            [
+                "Verse",
+                "Amazing grace! How sweet the sound\\nThat saved a wretch like me."
+            ],
+            [
+                "Chorus",
+                "I once was lost, but now am found\\nWas blind, but now I see."
+            ]
+        ],
+        "tags": "worship,classic,grace",
+        "created_at": "__NOW__",
+        "updated_at": "__NOW__"
+    }
+]"""
+
+_SAMPLE_THEMES_JSON = b"""[
+    {
+        "id": "default",
+        "name": "Default Theme",
+        "context": "Presentations",
+        "alignment": "Centered",
+        "font_color": "#ecf0f1",
+        "background_color": "#2c3e50",
+        "font_size": 18,
+        "font_family": "Arial",
+        "tags": "default,presentation",
+        "created_at": "__NOW__",
+        "updated_at": "__NOW__"
+    }
+]"""
+
+def _sample_songs(now: str) -> bytes:
+    """Default songs.json content."""
+    return _SAMPLE_SONGS_JSON.replace(_TIMESTAMP_PLACEHOLDER, now.encode())
+
+def _sample_media(now: str):
+    """Default media.json content."""
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "name": "sample_image.jpg",
+            "path": "Images/sample_image.jpg",
+            "category": "Images",
+            "tags": "worship,background",
+            "scaling": "fit",
+            "created_at": now,
+            "updated_at": now,
+            "is_logo": True
+        },
+        {
+            "id": str(uuid.uuid4()),
+            "name": "sample_video.mp4",
+            "path": "Videos/sample_video.mp4",
+            "category": "Videos",
+            "tags": "intro,loop",
+            "scaling": "fill",
+            "created_at": now,
+            "updated_at": now,
+            "is_logo": False
+        }
+    ]
+
+def _sample_presentations(now: str):
+    """Default presentations.json content."""
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "name": "Sample Sermon",
+            "theme": "default",
+            "slides": [
+                ["Text", "Welcome to our service!\nGod bless you all."],
+                ["Image", "Images/sample_image.jpg"],
+                ["Text", "Today's message: Love and Grace"]
+            ],
+            "tags": "sermon,worship,teaching",
+            "created_at": now,
+            "updated_at": now
+        }
+    ]
+
+def _sample_themes(now: str) -> bytes:
+    """Default themes.json content."""
+    return _SAMPLE_THEMES_JSON.replace(_TIMESTAMP_PLACEHOLDER, now.encode())
+
+def _sample_settings(now: str):
+    """Default settings.json content."""
+    return {
+        "general": {
+            "startup_screen": "Songs",
+            "language": "English",
+            "enable_tips": True,
+            "window_geometry": {"width": 1280, "height": 720, "x": 100, "y": 100}
+        },
+        "appearance": {
+            "theme": "Light",
+            "ui_font": DEFAULT_UI_FONT,
+            "enable_animations": True
+        },
+        "paths": {
+            "songs": "data/songs/songs.json",
+            "media": "data/media",
+            "media_metadata": "data/media/media.json",
+            "presentations": "data/presentations/presentations.json",
+            "themes": "data/themes/themes.json",
+            "bibles": "data/bibles",
+            "config": "data/config/settings.json"
+        },
+        "behavior": {
+            "auto_save_interval": 300,
+            "confirm_before_delete": True,
+            "default_playback_speed": 1.0
+        },
+        "advanced": {
+            "developer_mode": False,
+            "log_level": "INFO"
+        },
+        "accessibility": {
+            "high_contrast": False
+        }
+    }
+
+def _serialize_default(content) -> bytes:
+    """Return sample content as JSON bytes, passing pre-serialized samples through untouched."""
+    return content if isinstance(content, bytes) else json_io.dumps(content)
+
+# Size and mtime of each data file when it last parsed cleanly; kept in the configuration directory
+VALIDATION_CACHE_NAME = '.validated.json'
+
 def validate_data_files(settings_manager: SettingsManager):
     """Validate required data files and create defaults if missing."""
     try:
         logger.info("Starting data file validation")
-        sample_song = {
-            "title": "Amazing Grace",
-            "sections": [
-                ["Verse", "Amazing grace! How sweet the sound\nThat saved a wretch like me."],
-                ["Chorus", "I once was lost, but now am found\nWas blind, but now I see."]
-            ],
-            "tags": "worship,classic,grace",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
-        sample_media = [
-            {
-                "id": str(uuid.uuid4()),
-                "name": "sample_image.jpg",
-                "path": "Images/sample_image.jpg",
-                "category": "Images",
-                "tags": "worship,background",
-                "scaling": "fit",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
-                "is_logo": True
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "name": "sample_video.mp4",
-                "path": "Videos/sample_video.mp4",
-                "category": "Videos",
-                "tags": "intro,loop",
-                "scaling": "fill",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
-                "is_logo": False
-            }
-        ]
-        sample_presentation = [
-            {
-                "id": str(uuid.uuid4()),
-                "name": "Sample Sermon",
-                "theme": "default",
-                "slides": [
-                    ["Text", "Welcome to our service!\nGod bless you all."],
-                    ["Image", "Images/sample_image.jpg"],
-                    ["Text", "Today's message: Love and Grace"]
-                ],
-                "tags": "sermon,worship,teaching",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
-            }
-        ]
-        sample_themes = [
-            {
-                "id": "default",
-                "name": "Default Theme",
-                "context": "Presentations",
-                "alignment": "Centered",
-                "font_color": "#ecf0f1",
-                "background_color": "#2c3e50",
-                "font_size": 18,
-                "font_family": "Arial",
-                "tags": "default,presentation",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
-            }
-        ]
-        sample_settings = {
-            "general": {
-                "startup_screen": "Songs",
-                "language": "English",
-                "enable_tips": True,
-                "window_geometry": {"width": 1280, "height": 720, "x": 100, "y": 100}
-            },
-            "appearance": {
-                "theme": "Light",
-                "ui_font": QFont("Arial", 12).toString(),
-                "enable_animations": True
-            },
-            "paths": {
-                "songs": "data/songs/songs.json",
-                "media": "data/media",
-                "media_metadata": "data/media/media.json",
-                "presentations": "data/presentations/presentations.json",
-                "themes": "data/themes/themes.json",
-                "bibles": "data/bibles",
-                "config": "data/config/settings.json"
-            },
-            "behavior": {
-                "auto_save_interval": 300,
-                "confirm_before_delete": True,
-                "default_playback_speed": 1.0
-            },
-            "advanced": {
-                "developer_mode": False,
-                "log_level": "INFO"
-            },
-            "accessibility": {
-                "high_contrast": False
-            }
-        }
+        now = datetime.now().isoformat()
         data_files = {
-            settings_manager.get_setting("paths", "songs", "data/songs/songs.json"): [sample_song],
-            settings_manager.get_setting("paths", "media_metadata", "data/media/media.json"): sample_media,
-            settings_manager.get_setting("paths", "presentations", "data/presentations/presentations.json"): sample_presentation,
-            settings_manager.get_setting("paths", "themes", "data/themes/themes.json"): sample_themes,
-            settings_manager.get_setting("paths", "config", "data/config/settings.json"): sample_settings
+            settings_manager.get_setting("paths", "songs", "data/songs/songs.json"): _sample_songs,
+            settings_manager.get_setting("paths", "media_metadata", "data/media/media.json"): _sample_media,
+            settings_manager.get_setting("paths", "presentations", "data/presentations/presentations.json"): _sample_presentations,
+            settings_manager.get_setting("paths", "themes", "data/themes/themes.json"): _sample_themes,
+            settings_manager.get_setting("paths", "config", "data/config/settings.json"): _sample_settings
         }
-        logger.info(f"Settings loaded: {settings_manager.get_all_settings()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Settings loaded: %s", settings_manager.get_all_settings())
         missing_or_corrupted = []
-        for file_path, default_content in data_files.items():
+        validation_cache_file = settings_manager.config_path(VALIDATION_CACHE_NAME)
+        validation_cache = load_cache(validation_cache_file)
+        cache_changed = False
+        for file_path, make_default in data_files.items():
             try:
                 if file_path is None:
-                    logger.error(f"Invalid file path: None detected in data_files")
+                    logger.error("Invalid file path: None detected in data_files")
                     raise SanctifyError("Main", "DATA_FILE_004", "Invalid file path: None detected")
-                logger.info(f"Checking data file: {file_path}")
-                if not os.path.exists(file_path):
-                    logger.info(f"Data file missing, creating: {file_path}")
-                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(default_content, f, indent=4, ensure_ascii=False)
-                    logger.info(f"Created default data file: {file_path}")
-                else:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        json.load(f)  # Validate JSON
-                    logger.debug(f"Validated data file: {file_path}")
-            except json.JSONDecodeError as e:
-                logger.error(f"Corrupted data file {file_path}: %s", e)
+                logger.info("Checking data file: %s", file_path)
+                # The stat doubles as the existence check, so a present file costs one syscall here
+                try:
+                    signature = file_signature(file_path)
+                    settings_manager.mark_path_exists(file_path)
+                except FileNotFoundError:
+                    logger.info("Data file missing, creating: %s", file_path)
+                    directory = os.path.dirname(file_path)
+                    if directory and directory not in _ensured_dirs:
+                        os.makedirs(directory, exist_ok=True)
+                        _mark_ensured(directory)
+                    with open(file_path, 'wb') as f:
+                        f.write(_serialize_default(make_default(now)))
+                    settings_manager.mark_path_exists(file_path)
+                    logger.info("Created default data file: %s", file_path)
+                    continue
+                if validation_cache.get(file_path) == signature:
+                    logger.debug("Data file unchanged since last validation: %s", file_path)
+                    continue
+                json_io.load_file(file_path)  # Validate JSON
+                validation_cache[file_path] = signature
+                cache_changed = True
+                logger.debug("Validated data file: %s", file_path)
+            except json_io.JSONDecodeError as e:
+                logger.error("Corrupted data file %s: %s", file_path, e)
                 missing_or_corrupted.append(file_path)
                 try:
-                    logger.info(f"Restoring default data file: {file_path}")
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(default_content, f, indent=4, ensure_ascii=False)
-                    logger.info(f"Restored default data file: {file_path}")
+                    logger.info("Restoring default data file: %s", file_path)
+                    with open(file_path, 'wb') as f:
+                        f.write(_serialize_default(make_default(now)))
+                    logger.info("Restored default data file: %s", file_path)
                 except Exception as e:
-                    logger.error(f"Failed to restore data file {file_path}: %s", e)
+                    logger.error("Failed to restore data file %s: %s", file_path, e)
                     raise SanctifyError("Main", "DATA_FILE_001", f"Failed to restore data file {file_path}: {e}")
             except Exception as e:
-                logger.error(f"Error validating data file {file_path}: %s", e)
+                logger.error("Error validating data file %s: %s", file_path, e)
                 raise SanctifyError("Main", "DATA_FILE_002", f"Error validating data file {file_path}: {e}")
+        if cache_changed:
+            try:
+                write_cache(validation_cache_file, validation_cache)
+            except OSError as e:
+                logger.warning("Failed to write validation cache: %s", e)
         logger.info("Data file validation complete")
         return missing_or_corrupted
     except Exception as e:
@@ -297,7 +356,7 @@ def main():
         app = QApplication(sys.argv)
         app.setApplicationName("Sanctify Live")
         app.setApplicationVersion("1.0.1")
-        logger.info(f"Application: {app.applicationName()} v{app.applicationVersion()}")
+        logger.info("Application: %s v%s", app.applicationName(), app.applicationVersion())
 
         # Ensure directories
         logger.info("Ensuring directories")
@@ -307,13 +366,14 @@ def main():
         # Initialize SettingsManager
         logger.info("Initializing SettingsManager")
         settings_manager = SettingsManager()
+        app.aboutToQuit.connect(settings_manager.flush)
         logger.info("SettingsManager initialized")
 
         # Validate assets
         logger.info("Validating assets")
         missing_assets = validate_assets()
         if missing_assets:
-            logger.warning(f"Missing assets: {', '.join(missing_assets)}")
+            logger.warning("Missing assets: %s", ', '.join(missing_assets))
             QMessageBox.warning(None, "Asset Warning", f"Missing assets: {', '.join(missing_assets)}. UI may be incomplete.")
         logger.info("Assets validated")
 
@@ -321,96 +381,63 @@ def main():
         logger.info("Validating data files")
         missing_data_files = validate_data_files(settings_manager)
         if missing_data_files:
-            logger.warning(f"Corrupted or missing data files: {', '.join(missing_data_files)}")
+            logger.warning("Corrupted or missing data files: %s", ', '.join(missing_data_files))
             QMessageBox.warning(None, "Data Warning", f"Restored default data for: {', '.join(missing_data_files)}")
         logger.info("Data files validated")
 
         # Validate paths (temporarily skip due to SettingsManager error)
         logger.info("Validating settings paths")
         try:
-            path_validity = settings_manager.validate_paths()
-            for key, valid in path_validity.items():
-                if not valid:
-                    logger.warning(f"Invalid path in settings: {key} = {settings_manager.get_setting('paths', key)}")
+            # validate_paths logs every invalid path in one batched warning
+            settings_manager.validate_paths()
             logger.info("Settings paths validated")
         except Exception as e:
-            logger.warning(f"Skipping path validation due to error: {e}")
+            logger.warning("Skipping path validation due to error: %s", e)
             QMessageBox.warning(None, "Settings Warning", f"Path validation failed: {e}. Continuing with default paths.")
 
         # Load translations
         logger.info("Loading translations")
-        translator = QTranslator()
         language = settings_manager.get_setting("general", "language", "English")
-        if translator.load(f"assets/translations/{language.lower()}.qm"):
+        qm_name = f"{language.lower()}.qm"
+        # English is built in; other languages load only when the .qm is present, sparing Qt's probe walk
+        translator = QTranslator()
+        if (language != "English" and qm_name in _dir_listing("assets/translations")
+                and translator.load(f"assets/translations/{qm_name}")):
             app.installTranslator(translator)
-            logger.info(f"Loaded translation: {language}")
+            logger.info("Loaded translation: %s", language)
         else:
-            logger.debug(f"No translation file found for language: {language}")
+            logger.debug("No translation file found for language: %s", language)
         logger.info("Translations loaded")
 
         # Show splash screen with progress bar
         logger.info("Showing splash screen")
-        splash_path = "assets/images/splash.png"
-        splash_pixmap = QPixmap(splash_path) if os.path.exists(splash_path) else QPixmap()
+        # validate_assets already listed assets/images, so no extra stat is needed here
+        splash_pixmap = QPixmap("assets/images/splash.png") if "splash.png" in _dir_listing("assets/images") else QPixmap()
         splash = QSplashScreen(splash_pixmap)
-        splash.setStyleSheet("""
-            QSplashScreen {
-                background: #2c3e50;
-                border: 2px solid #3498db;
-            }
-        """)
+        splash.setStyleSheet(SPLASH_QSS)
         progress_bar = QProgressBar(splash)
         progress_bar.setGeometry(50, splash.height() - 50, splash.width() - 100, 20)
-        progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #3498db;
-                border-radius: 3px;
-                background: #ecf0f1;
-                text-align: center;
-                color: #2c3e50;
-            }
-            QProgressBar::chunk {
-                background: #3498db;
-            }
-        """)
         splash.show()
         splash.showMessage("Initializing Sanctify Live...", Qt.AlignBottom | Qt.AlignCenter, Qt.white)
         app.processEvents()
         logger.info("Splash screen shown")
 
-        # Initialize components with progress updates
+        # Initialize components; the tabs build and load their own models, so the window is the only step
         logger.info("Initializing components")
-        components = {}
-        progress_steps = [
-            ("Loading song model...", lambda: SongModel(settings_manager)),
-            ("Loading media model...", lambda: MediaModel(settings_manager)),
-            ("Loading presentation model...", lambda: PresentationModel(settings_manager)),
-            ("Loading theme model...", lambda: ThemeModel(settings_manager)),
-            ("Loading scripture model...", lambda: ScriptureModel(settings_manager)),
-            ("Initializing main window...", lambda: SanctifyApp())
-        ]
-        for i, (message, task) in enumerate(progress_steps):
-            try:
-                logger.info(f"Starting task: {message}")
-                progress = int((i + 1) / len(progress_steps) * 100)
-                splash.showMessage(message, Qt.AlignBottom | Qt.AlignCenter, Qt.white)
-                progress_bar.setValue(progress)
-                app.processEvents()
-                components[message] = task()
-                logger.debug(f"Completed startup task: {message}")
-            except Exception as e:
-                logger.error(f"Failed startup task '{message}': %s", e)
-                raise SanctifyError("Main", f"INIT_{i+1:03d}", f"Failed startup task '{message}': {e}")
+        step_message = "Initializing main window..."
+        try:
+            logger.info("Starting task: %s", step_message)
+            splash.showMessage(step_message, Qt.AlignBottom | Qt.AlignCenter, Qt.white)
+            app.processEvents()
+            # Imported here so the window modules load after the splash is up
+            from ui.main_window import SanctifyApp
+            window = SanctifyApp(settings_manager)
+            progress_bar.setValue(100)
+        except Exception as e:
+            logger.error("Failed startup task '%s': %s", step_message, e)
+            raise SanctifyError("Main", "INIT_006", f"Failed startup task '{step_message}': {e}")
         logger.info("Components initialized")
 
-        # Get main window
-        logger.info("Retrieving main window")
-        window = components.get("Initializing main window...")
-        if not window:
-            logger.error("Main window initialization failed")
-            raise SanctifyError("Main", "INIT_WINDOW_001", "Main window initialization failed")
-        logger.info("Main window retrieved")
-
         # Configure main window
         logger.info("Configuring main window")
         window.setAccessibleName("Sanctify Live")
@@ -424,24 +451,7 @@ def main():
         startup_screen = settings_manager.get_setting("general", "startup_screen", "Songs")
         tab_index = {"Songs": 0, "Scriptures": 1, "Media": 2, "Presentations": 3, "Themes": 4}.get(startup_screen, 0)
         window.tabs.setCurrentIndex(tab_index)
-        logger.info(f"Startup screen set to {startup_screen}")
-
-        # Apply accessibility settings
-        logger.info("Applying accessibility settings")
-        if settings_manager.get_setting("accessibility", "high_contrast", False):
-            app.setStyleSheet(app.styleSheet() + """
-                QWidget {
-                    background: #000000;
-                    color: #ffffff;
-                }
-                QPushButton {
-                    border: 2px solid #ffffff;
-                    background: #000000;
-                    color: #ffffff;
-                }
-            """)
-            logger.info("Applied high-contrast accessibility mode")
-        logger.info("Accessibility settings applied")
+        logger.info("Startup screen set to %s", startup_screen)
 
         # Show window with animation
         logger.info("Showing main window")
@@ -457,10 +467,11 @@ def main():
             logger.info("Window animation started")
         QTimer.singleShot(500, splash.close)
         window.status_bar.showMessage(f"Started on {startup_screen} tab")
-        logger.info(f"Main window shown on {startup_screen} tab")
+        logger.info("Main window shown on %s tab", startup_screen)
 
-        # Save window geometry on close
+        # Save window geometry on close, then run the window's own close handling
         logger.info("Setting up close event handler")
+        window_close_event = window.closeEvent
         def save_geometry(event):
             try:
                 logger.info("Saving window geometry")
@@ -471,7 +482,8 @@ def main():
                     "y": window.y()
                 })
                 logger.info("Window geometry saved")
-                event.accept()
+                # Saves the window state and flushes the debounced settings write synchronously
+                window_close_event(event)
             except Exception as e:
                 logger.error("Failed to save window geometry: %s", e)
                 raise SanctifyError("Main", "SAVE_GEOMETRY_001", f"Failed to save window geometry: {e}")
@@ -1,46 +1,115 @@
 import os
-import json
 import uuid
 import shutil
+import bisect
 import logging
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from core.settings_manager import SettingsManager
 from core.exceptions import SanctifyError
+from core import json_io
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data/logs/sanctify.log'),
-        logging.StreamHandler()
-    ]
-)
+# Handlers are configured once by the application entry point
 logger = logging.getLogger(__name__)
 
+# Fields every media record must carry, with their required types
+_MEDIA_FIELD_TYPES = (
+    ("id", str),
+    ("name", str),
+    ("path", str),
+    ("tags", str),
+    ("created_at", str),
+    ("updated_at", str),
+    ("is_logo", bool),
+)
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy file contents without metadata, letting the kernel clone or copy in place where it can."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
 class MediaModel:
     SUPPORTED_FORMATS = {
         "Images": [".jpg", ".jpeg", ".png", ".bmp"],
         "Videos": [".mp4", ".mov", ".avi"],
         "Gifs": [".gif"]
     }
+    # Extension -> category, and every supported extension, for single-lookup checks
+    _EXT_TO_CATEGORY = {ext: category for category, exts in SUPPORTED_FORMATS.items() for ext in exts}
+    _ALL_EXTS = frozenset(_EXT_TO_CATEGORY)
+    # Allowed category and scaling values, as sets for the validation hot path
+    _CATEGORIES = frozenset(SUPPORTED_FORMATS)
+    _SCALINGS = frozenset({"stretch", "fit", "fill"})
 
     def __init__(self, settings_manager: SettingsManager):
         """Initialize MediaModel with SettingsManager."""
         self.settings_manager = settings_manager
+        # Kept sorted by lowercased name, so listings need no per-call sort
         self.media: List[Dict] = []
+        # Lookup indexes kept in step with self.media
+        self._by_id: Dict[str, Dict] = {}
+        self._by_path: Set[str] = set()
+        # Id of the single item flagged is_logo, so the logo is found and moved without a scan
+        self._logo_id: Optional[str] = None
+        # Per-id search keys, computed once when an item is indexed
+        self._name_lower: Dict[str, str] = {}
+        self._tags: Dict[str, frozenset] = {}
+        # Lowercased tags joined by newlines, so one substring scan tests every tag without matching across two
+        self._tags_lower: Dict[str, str] = {}
+        # Relative paths of files present in the category folders, from one scandir per folder
+        self._existing_paths: Set[str] = set()
+        # Saves requested inside batch() are deferred and written once when the batch ends
+        self._dirty = False
+        self._batch_depth = 0
         try:
-            self._ensure_directories()
+            self.refresh_paths()
             self._load_media()
         except Exception as e:
             raise SanctifyError("MediaModel", "INIT_001", f"Initialization failed: {e}")
+        # The paths are resolved once, so follow the settings when the media locations move
+        self.settings_manager.settings_changed.connect(self._on_setting_changed)
 
-    def _ensure_directories(self) -> None:
-        """Create media directories if they don't exist."""
+    def _on_setting_changed(self, section: str, key: str, value) -> None:
+        """Switch to a new media directory or metadata file when the paths settings change."""
+        if section != "paths" or key not in ("media", "media_metadata"):
+            return
+        try:
+            # Pending changes belong to the old location, so write them there first
+            self.flush()
+            self.refresh_paths()
+            self._load_media()
+        except SanctifyError as e:
+            logger.error(f"Failed to switch media location: {e}")
+
+    def refresh_paths(self) -> None:
+        """Resolve the media directory and metadata file from settings; called again when they change."""
         media_dir = self.settings_manager.get_setting("paths", "media", "data/media")
         if not isinstance(media_dir, str):
             raise SanctifyError("MediaModel", "PATH_001", f"Invalid media directory type: {type(media_dir)}, expected string")
+        media_file = self.settings_manager.get_setting("paths", "media_metadata", "data/media/media.json")
+        if not isinstance(media_file, str):
+            raise SanctifyError("MediaModel", "PATH_002", f"Invalid media metadata path type: {type(media_file)}, expected string")
+        self._media_dir = media_dir
+        self._media_file = media_file
+        self._ensure_directories()
+
+    def _ensure_directories(self) -> None:
+        """Create media directories if they don't exist."""
+        media_dir = self._media_dir
         try:
             os.makedirs(media_dir, exist_ok=True)
             for category in self.SUPPORTED_FORMATS:
@@ -51,23 +120,33 @@ class MediaModel:
 
     def _load_media(self) -> None:
         """Load media metadata from JSON file."""
-        media_file = self.settings_manager.get_setting("paths", "media_metadata", "data/media/media.json")
-        if not isinstance(media_file, str):
-            raise SanctifyError("MediaModel", "PATH_002", f"Invalid media metadata path type: {type(media_file)}, expected string")
-
+        media_file = self._media_file
         self.media.clear()
-        if os.path.exists(media_file):
+        self._by_id.clear()
+        self._by_path.clear()
+        self._name_lower.clear()
+        self._tags.clear()
+        self._tags_lower.clear()
+        self._logo_id = None
+        if self.settings_manager.path_exists(media_file):
             try:
-                with open(media_file, 'r', encoding='utf-8') as f:
-                    loaded_media = json.load(f)
-                    if not isinstance(loaded_media, list):
-                        raise SanctifyError("MediaModel", "LOAD_001", f"Media file {media_file} is not a list")
-                    for item in loaded_media:
-                        if self._validate_media(item):
-                            self.media.append(item)
-                        else:
-                            logger.warning(f"Invalid media data: {item.get('name', 'Unknown')}")
-            except json.JSONDecodeError as e:
+                self._scan_existing_files()
+                loaded_media = json_io.load_file(media_file)
+                if not isinstance(loaded_media, list):
+                    raise SanctifyError("MediaModel", "LOAD_001", f"Media file {media_file} is not a list")
+                # Compact the parsed list in place and adopt it, so no second list of items is built
+                kept = 0
+                for item in loaded_media:
+                    if self._validate_media(item):
+                        loaded_media[kept] = item
+                        kept += 1
+                        self._index(item)
+                    else:
+                        logger.warning(f"Invalid media data: {item.get('name', 'Unknown')}")
+                del loaded_media[kept:]
+                loaded_media.sort(key=self._sort_key)
+                self.media = loaded_media
+            except json_io.JSONDecodeError as e:
                 raise SanctifyError("MediaModel", "LOAD_002", f"Error decoding JSON from {media_file}: {e}")
             except Exception as e:
                 raise SanctifyError("MediaModel", "LOAD_003", f"Error loading media from {media_file}: {e}")
@@ -76,31 +155,121 @@ class MediaModel:
             self._save_media()
 
     def _save_media(self) -> None:
-        """Save media metadata to JSON file."""
-        media_file = self.settings_manager.get_setting("paths", "media_metadata", "data/media/media.json")
+        """Save media metadata to JSON file, or mark it dirty while a batch is open."""
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending media metadata atomically through a temporary file."""
+        if not self._dirty:
+            return
+        media_file = self._media_file
         try:
             os.makedirs(os.path.dirname(media_file), exist_ok=True)
-            with open(media_file, 'w', encoding='utf-8') as f:
-                json.dump(self.media, f, indent=4, ensure_ascii=False)
+            tmp_file = f"{media_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(json_io.dumps(self.media))
+            os.replace(tmp_file, media_file)
+            self._dirty = False
             logger.info(f"Saved media metadata to {media_file}")
         except Exception as e:
             raise SanctifyError("MediaModel", "SAVE_001", f"Error saving media to {media_file}: {e}")
 
+    @contextmanager
+    def batch(self):
+        """Defer metadata saves until the outermost batch exits, then write once."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def _list_category(self, category: str) -> List[str]:
+        """Return the category-relative paths of the files in one category folder."""
+        try:
+            with os.scandir(os.path.join(self._media_dir, category)) as entries:
+                return [os.path.join(category, entry.name) for entry in entries]
+        except OSError as e:
+            logger.warning(f"Could not list media folder {category}: {e}")
+            return []
+
+    def _scan_existing_files(self) -> None:
+        """List each category folder once, so validation can skip a stat per item."""
+        self._existing_paths.clear()
+        # The folders are listed concurrently so directory reads on network shares overlap
+        with ThreadPoolExecutor(max_workers=len(self.SUPPORTED_FORMATS)) as executor:
+            for paths in executor.map(self._list_category, self.SUPPORTED_FORMATS):
+                self._existing_paths.update(paths)
+
+    def media_file_exists(self, rel_path: str) -> bool:
+        """Check a media file against the scanned folders, falling back to the filesystem on a miss."""
+        if rel_path in self._existing_paths:
+            return True
+        if os.path.exists(os.path.join(self._media_dir, rel_path)):
+            self._existing_paths.add(rel_path)
+            return True
+        return False
+
+    def _sort_key(self, media: Dict) -> str:
+        """Sort key for self.media: the cached lowercased name of an indexed item."""
+        return self._name_lower[media["id"]]
+
+    def _insert_sorted(self, media: Dict) -> None:
+        """Index a media item and insert it at its sorted position."""
+        self._index(media)
+        bisect.insort_right(self.media, media, key=self._sort_key)
+
+    def _position(self, media: Dict) -> int:
+        """Return the list index of an indexed item, found by bisecting on its sort key."""
+        position = bisect.bisect_left(self.media, self._sort_key(media), key=self._sort_key)
+        while self.media[position] is not media:
+            position += 1
+        return position
+
+    def _index(self, media: Dict) -> None:
+        """Add a media item to the id and path indexes and cache its search keys."""
+        media_id = media["id"]
+        self._by_id[media_id] = media
+        self._by_path.add(media["path"])
+        if media["is_logo"]:
+            if self._logo_id is None:
+                self._logo_id = media_id
+            else:
+                # Only one logo is kept; extra flags left in older files are cleared
+                media["is_logo"] = False
+        tags = frozenset(t for t in (t.strip() for t in media.get("tags", "").split(",")) if t)
+        self._name_lower[media_id] = media["name"].lower()
+        self._tags[media_id] = tags
+        self._tags_lower[media_id] = "\n".join(tags).lower()
+
+    def _unindex(self, media: Dict) -> None:
+        """Remove a media item from the id and path indexes and drop its search keys."""
+        media_id = media["id"]
+        self._by_id.pop(media_id, None)
+        self._by_path.discard(media["path"])
+        if self._logo_id == media_id:
+            self._logo_id = None
+        self._name_lower.pop(media_id, None)
+        self._tags.pop(media_id, None)
+        self._tags_lower.pop(media_id, None)
+
     def _validate_media(self, media: Dict) -> bool:
         """Validate media data structure."""
         try:
-            media_dir = self.settings_manager.get_setting("paths", "media", "data/media")
+            if not isinstance(media, dict):
+                return False
+            for field, field_type in _MEDIA_FIELD_TYPES:
+                if not isinstance(media.get(field), field_type):
+                    return False
+            # Value checks run cheapest first; the file check is the only one that may touch the disk
             return (
-                isinstance(media, dict) and
-                "id" in media and isinstance(media["id"], str) and
-                "name" in media and isinstance(media["name"], str) and media["name"].strip() and
-                "path" in media and isinstance(media["path"], str) and os.path.exists(os.path.join(media_dir, media["path"])) and
-                "category" in media and media["category"] in self.SUPPORTED_FORMATS and
-                "tags" in media and isinstance(media["tags"], str) and
-                "scaling" in media and media["scaling"] in ["stretch", "fit", "fill"] and
-                "created_at" in media and isinstance(media["created_at"], str) and
-                "updated_at" in media and isinstance(media["updated_at"], str) and
-                "is_logo" in media and isinstance(media["is_logo"], bool)
+                bool(media["name"].strip()) and
+                media.get("category") in self._CATEGORIES and
+                media.get("scaling") in self._SCALINGS and
+                self.media_file_exists(media["path"])
             )
         except Exception as e:
             raise SanctifyError("MediaModel", "VALIDATE_001", f"Error validating media: {e}")
@@ -108,15 +277,16 @@ class MediaModel:
     def get_all_media(self, category: str = "") -> List[Dict]:
         """Return all media or filtered by category, sorted by name."""
         try:
-            media = self.media if not category else [m for m in self.media if m["category"] == category]
-            return sorted(media, key=lambda m: m["name"].lower())
+            if not category:
+                return list(self.media)
+            return [m for m in self.media if m["category"] == category]
         except Exception as e:
             raise SanctifyError("MediaModel", "GET_ALL_001", f"Error retrieving media: {e}")
 
     def get_media_by_id(self, media_id: str) -> Optional[Dict]:
         """Retrieve a media item by its ID."""
         try:
-            return next((m for m in self.media if m["id"] == media_id), None)
+            return self._by_id.get(media_id)
         except Exception as e:
             raise SanctifyError("MediaModel", "GET_BY_ID_001", f"Error retrieving media by ID {media_id}: {e}")
 
@@ -129,35 +299,32 @@ class MediaModel:
             for media in self.media:
                 if category and media["category"] != category:
                     continue
-                matches_query = query in media["name"].lower() or any(query in t.lower() for t in media.get("tags", "").split(","))
-                matches_tag = not tag or tag in media.get("tags", "").lower()
+                media_id = media["id"]
+                tags_lower = self._tags_lower[media_id]
+                matches_query = query in self._name_lower[media_id] or query in tags_lower
+                matches_tag = not tag or tag in tags_lower
                 if matches_query and matches_tag:
                     results.append(media)
-            return sorted(results, key=lambda m: m["name"].lower())
+            return results
         except Exception as e:
             raise SanctifyError("MediaModel", "SEARCH_001", f"Error searching media with query {query}: {e}")
 
     def get_all_tags(self) -> List[str]:
         """Return a sorted list of unique tags."""
         try:
-            tags = set()
-            for media in self.media:
-                for tag in media.get("tags", "").split(","):
-                    tag = tag.strip()
-                    if tag:
-                        tags.add(tag)
-            return sorted(tags)
+            return sorted(set().union(*self._tags.values()))
         except Exception as e:
             raise SanctifyError("MediaModel", "GET_TAGS_001", f"Error retrieving tags: {e}")
 
     def add_media(self, source_path: str, category: str, display_name: str = "", tags: str = "", scaling: str = "fit") -> Optional[Dict]:
-        """Add a new media file and metadata."""
+        """Add a new media file and metadata; an empty category is inferred from the extension."""
         try:
-            media_dir = self.settings_manager.get_setting("paths", "media", "data/media")
+            media_dir = self._media_dir
             ext = os.path.splitext(source_path)[1].lower()
-            if not any(ext in formats for formats in self.SUPPORTED_FORMATS.values()):
+            if ext not in self._ALL_EXTS:
                 raise SanctifyError("MediaModel", "ADD_001", f"Unsupported media format: {ext}")
-            if category not in self.SUPPORTED_FORMATS:
+            category = category or self._EXT_TO_CATEGORY[ext]
+            if category not in self._CATEGORIES:
                 raise SanctifyError("MediaModel", "ADD_002", f"Invalid category: {category}")
 
             media_id = str(uuid.uuid4())
@@ -167,10 +334,11 @@ class MediaModel:
 
             try:
                 os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                shutil.copy2(source_path, target_path)
+                _fast_copy(source_path, target_path)
             except Exception as e:
                 raise SanctifyError("MediaModel", "ADD_003", f"Failed to copy media file {source_path} to {target_path}: {e}")
 
+            now = datetime.now().isoformat()
             media_data = {
                 "id": media_id,
                 "name": display_name,
@@ -178,12 +346,12 @@ class MediaModel:
                 "category": category,
                 "tags": tags.strip(),
                 "scaling": scaling.lower(),
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at": now,
+                "updated_at": now,
                 "is_logo": False
             }
 
-            if any(m["path"] == media_data["path"] for m in self.media):
+            if media_data["path"] in self._by_path:
                 try:
                     os.remove(target_path)
                 except Exception:
@@ -191,13 +359,14 @@ class MediaModel:
                 raise SanctifyError("MediaModel", "ADD_004", f"Media already exists: {target_path}")
 
             if not self._validate_media(media_data):
+                self._existing_paths.discard(media_data["path"])
                 try:
                     os.remove(target_path)
                 except Exception:
                     pass
                 raise SanctifyError("MediaModel", "ADD_005", f"Invalid media data for {display_name}")
 
-            self.media.append(media_data)
+            self._insert_sorted(media_data)
             self._save_media()
             logger.info(f"Added media: {display_name}")
             return media_data
@@ -206,6 +375,11 @@ class MediaModel:
         except Exception as e:
             raise SanctifyError("MediaModel", "ADD_006", f"Error adding media: {e}")
 
+    def add_media_bulk(self, source_paths: List[str], category: str, tags: str = "", scaling: str = "fit") -> List[Dict]:
+        """Add several media files, writing the metadata file once at the end."""
+        with self.batch():
+            return [self.add_media(path, category, "", tags, scaling) for path in source_paths]
+
     def update_media(self, media_id: str, media_data: Dict) -> bool:
         """Update media metadata."""
         try:
@@ -228,22 +402,31 @@ class MediaModel:
             if "scaling" not in media_data:
                 media_data["scaling"] = media["scaling"]
 
-            media_dir = self.settings_manager.get_setting("paths", "media", "data/media")
+            media_dir = self._media_dir
             if media_data["name"] != media["name"] or media_data["category"] != media["category"]:
-                new_filename = f"{media_id}{os.path.splitext(media['path'])[1]}"
-                new_path = os.path.join(media_dir, media_data["category"], new_filename)
+                new_rel_path = os.path.join(media_data["category"], f"{media_id}{os.path.splitext(media['path'])[1]}")
+                new_path = os.path.join(media_dir, new_rel_path)
                 try:
                     os.makedirs(os.path.dirname(new_path), exist_ok=True)
-                    os.rename(os.path.join(media_dir, media["path"]), os.path.join(media_dir, new_path))
-                    media_data["path"] = os.path.join(media_data["category"], new_filename)
+                    os.rename(os.path.join(media_dir, media["path"]), new_path)
+                    self._existing_paths.discard(media["path"])
+                    media_data["path"] = new_rel_path
                 except Exception as e:
                     raise SanctifyError("MediaModel", "UPDATE_002", f"Failed to rename media from {media['path']} to {new_path}: {e}")
 
             if not self._validate_media(media_data):
                 raise SanctifyError("MediaModel", "UPDATE_003", f"Invalid media data for {media_data['name']}")
 
-            self.media.remove(media)
-            self.media.append(media_data)
+            position = self._position(media)
+            same_key = media_data["name"].lower() == self._name_lower[media_id]
+            self._unindex(media)
+            if same_key:
+                # The sort key is unchanged, so the record is swapped in at its current position
+                self._index(media_data)
+                self.media[position] = media_data
+            else:
+                del self.media[position]
+                self._insert_sorted(media_data)
             self._save_media()
             logger.info(f"Updated media: {media_data['name']}")
             return True
@@ -259,11 +442,13 @@ class MediaModel:
             if not media:
                 raise SanctifyError("MediaModel", "DELETE_001", f"Media not found: {media_id}")
             try:
-                media_dir = self.settings_manager.get_setting("paths", "media", "data/media")
+                media_dir = self._media_dir
                 os.remove(os.path.join(media_dir, media["path"]))
+                self._existing_paths.discard(media["path"])
             except Exception as e:
                 raise SanctifyError("MediaModel", "DELETE_002", f"Failed to delete media file {media['path']}: {e}")
-            self.media.remove(media)
+            del self.media[self._position(media)]
+            self._unindex(media)
             self._save_media()
             logger.info(f"Deleted media: {media['name']}")
             return True
@@ -279,38 +464,40 @@ class MediaModel:
             if not media:
                 raise SanctifyError("MediaModel", "DUPLICATE_001", f"Media not found: {media_id}")
 
-            media_dir = self.settings_manager.get_setting("paths", "media", "data/media")
+            media_dir = self._media_dir
             new_id = str(uuid.uuid4())
-            ext = os.path.splitext(media["path"])[1]
-            new_filename = f"{new_id}{ext}"
-            new_path = os.path.join(media_dir, media["category"], new_filename)
-            new_name = f"{media['name'].rsplit('.', 1)[0]} (Copy).{media['name'].rsplit('.', 1)[1]}"
+            new_rel_path = os.path.join(media["category"], f"{new_id}{os.path.splitext(media['path'])[1]}")
+            new_path = os.path.join(media_dir, new_rel_path)
+            stem, dot, suffix = media["name"].rpartition(".")
+            new_name = f"{stem} (Copy).{suffix}" if dot else f"{media['name']} (Copy)"
 
             try:
-                shutil.copy2(os.path.join(media_dir, media["path"]), new_path)
+                _fast_copy(os.path.join(media_dir, media["path"]), new_path)
             except Exception as e:
                 raise SanctifyError("MediaModel", "DUPLICATE_002", f"Failed to duplicate media {media['path']} to {new_path}: {e}")
 
+            now = datetime.now().isoformat()
             new_media = {
                 "id": new_id,
                 "name": new_name,
-                "path": os.path.join(media["category"], new_filename),
+                "path": new_rel_path,
                 "category": media["category"],
                 "tags": media["tags"],
                 "scaling": media["scaling"],
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at": now,
+                "updated_at": now,
                 "is_logo": False
             }
 
             if not self._validate_media(new_media):
+                self._existing_paths.discard(new_media["path"])
                 try:
                     os.remove(new_path)
                 except Exception:
                     pass
                 raise SanctifyError("MediaModel", "DUPLICATE_003", f"Invalid duplicated media data for {new_name}")
 
-            self.media.append(new_media)
+            self._insert_sorted(new_media)
             self._save_media()
             logger.info(f"Duplicated media: {new_name}")
             return new_media
@@ -325,8 +512,11 @@ class MediaModel:
             media = self.get_media_by_id(media_id)
             if not media or media["category"] != "Images":
                 raise SanctifyError("MediaModel", "SET_LOGO_001", f"Invalid logo media: {media_id} (must be an image)")
-            for m in self.media:
-                m["is_logo"] = (m["id"] == media_id)
+            old_logo = self._by_id.get(self._logo_id)
+            if old_logo is not None:
+                old_logo["is_logo"] = False
+            media["is_logo"] = True
+            self._logo_id = media_id
             self._save_media()
             logger.info(f"Set logo: {media['name']}")
             return True
@@ -338,6 +528,6 @@ class MediaModel:
     def get_logo_media(self) -> Optional[Dict]:
         """Return the current logo media."""
         try:
-            return next((m for m in self.media if m.get("is_logo", False)), None)
+            return self._by_id.get(self._logo_id)
         except Exception as e:
             raise SanctifyError("MediaModel", "GET_LOGO_001", f"Error retrieving logo media: {e}")
\ No newline at end of file
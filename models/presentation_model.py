@@ -1,11 +1,12 @@
 import os
-import json
 import uuid
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
+from PyQt5.QtCore import QTimer
 from core.settings_manager import SettingsManager
 from core.exceptions import SanctifyError
+from core import json_io
 from models.media_model import MediaModel
 from models.theme_model import ThemeModel
 
@@ -20,6 +21,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fields every presentation record must carry, with their required types
+_PRESENTATION_FIELD_TYPES = (
+    ("id", str),
+    ("name", str),
+    ("slides", list),
+    ("theme", str),
+    ("tags", str),
+    ("created_at", str),
+    ("updated_at", str),
+)
+# Slide types, and those whose content is a media path
+_SLIDE_TYPES = frozenset({"Text", "Image", "Video"})
+_MEDIA_SLIDE_TYPES = frozenset({"Image", "Video"})
+
 class PresentationModel:
     def __init__(self, settings_manager: SettingsManager, media_model: Optional[MediaModel] = None, theme_model: Optional[ThemeModel] = None):
         """Initialize PresentationModel with SettingsManager and optional MediaModel, ThemeModel."""
@@ -27,6 +42,21 @@ class PresentationModel:
         self.media_model = media_model
         self.theme_model = theme_model
         self.presentations: List[Dict] = []
+        # Lookup indexes kept in step with self.presentations
+        self._by_id: Dict[str, Dict] = {}
+        self._by_lname: Dict[str, Dict] = {}
+        # Per-id search keys, computed once when a presentation is indexed
+        self._name_lower: Dict[str, str] = {}
+        self._tags_lower: Dict[str, frozenset] = {}
+        # Sorted listing and tag list, rebuilt on first use after any change
+        self._sorted_cache: Optional[List[Dict]] = None
+        self._tags_cache: Optional[List[str]] = None
+        # Mutations mark the presentations dirty and the timer writes them once things go quiet
+        self._dirty = False
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_save)
         try:
             self._ensure_directories()
             self._load_presentations()
@@ -48,18 +78,23 @@ class PresentationModel:
         """Load presentation metadata from JSON file."""
         presentations_file = self.settings_manager.get_setting("paths", "presentations", "data/presentations/presentations.json")
         self.presentations.clear()
-        if os.path.exists(presentations_file):
+        self._by_id.clear()
+        self._by_lname.clear()
+        self._name_lower.clear()
+        self._tags_lower.clear()
+        self._invalidate_caches()
+        if self.settings_manager.path_exists(presentations_file):
             try:
-                with open(presentations_file, 'r', encoding='utf-8') as f:
-                    loaded_presentations = json.load(f)
-                    if not isinstance(loaded_presentations, list):
-                        raise SanctifyError("PresentationModel", "LOAD_001", f"Presentations file {presentations_file} is not a list")
-                    for item in loaded_presentations:
-                        if self._validate_presentation(item):
-                            self.presentations.append(item)
-                        else:
-                            logger.warning(f"Invalid presentation data: {item.get('name', 'Unknown')}")
-            except json.JSONDecodeError as e:
+                loaded_presentations = json_io.load_file(presentations_file)
+                if not isinstance(loaded_presentations, list):
+                    raise SanctifyError("PresentationModel", "LOAD_001", f"Presentations file {presentations_file} is not a list")
+                for item in loaded_presentations:
+                    if self._validate_presentation(item):
+                        self.presentations.append(item)
+                        self._index(item)
+                    else:
+                        logger.warning(f"Invalid presentation data: {item.get('name', 'Unknown')}")
+            except json_io.JSONDecodeError as e:
                 raise SanctifyError("PresentationModel", "LOAD_002", f"Error decoding JSON from {presentations_file}: {e}")
             except Exception as e:
                 raise SanctifyError("PresentationModel", "LOAD_003", f"Error loading presentations from {presentations_file}: {e}")
@@ -68,40 +103,85 @@ class PresentationModel:
             self._save_presentations()
 
     def _save_presentations(self) -> None:
-        """Save presentation metadata to JSON file."""
+        """Save presentation metadata to JSON file atomically through a temporary file."""
         presentations_file = self.settings_manager.get_setting("paths", "presentations", "data/presentations/presentations.json")
         try:
-            with open(presentations_file, 'w', encoding='utf-8') as f:
-                json.dump(self.presentations, f, indent=4, ensure_ascii=False)
+            tmp_file = f"{presentations_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(json_io.dumps(self.presentations))
+            os.replace(tmp_file, presentations_file)
+            self._dirty = False
             logger.info(f"Saved presentations to {presentations_file}")
         except Exception as e:
             raise SanctifyError("PresentationModel", "SAVE_001", f"Error saving presentations to {presentations_file}: {e}")
 
+    def _schedule_save(self) -> None:
+        """Mark presentations dirty and (re)start the debounced save."""
+        self._dirty = True
+        self._save_timer.start()
+
+    def _flush_save(self) -> None:
+        """Write presentations from the save timer if anything changed since the last save."""
+        if not self._dirty:
+            return
+        try:
+            self._save_presentations()
+        except SanctifyError:
+            # SanctifyError has logged the cause; an exception escaping the timer slot would abort the app,
+            # so the data stays dirty and the next flush retries the write
+            logger.error("Deferred presentations save failed, keeping changes for the next save")
+
+    def flush(self) -> None:
+        """Write any pending presentation changes immediately, e.g. on shutdown; raises SAVE_001 on failure."""
+        self._save_timer.stop()
+        if self._dirty:
+            self._save_presentations()
+
+    def _invalidate_caches(self) -> None:
+        """Drop the memoized listing and tags after the presentations change."""
+        self._sorted_cache = None
+        self._tags_cache = None
+
+    def _index(self, presentation: Dict) -> None:
+        """Add a presentation to the id and lowercased-name indexes."""
+        self._invalidate_caches()
+        presentation_id = presentation["id"]
+        lname = presentation["name"].lower()
+        self._by_id[presentation_id] = presentation
+        self._by_lname[lname] = presentation
+        self._name_lower[presentation_id] = lname
+        self._tags_lower[presentation_id] = frozenset(t for t in (t.strip() for t in presentation.get("tags", "").lower().split(",")) if t)
+
+    def _unindex(self, presentation: Dict) -> None:
+        """Remove a presentation from the id and lowercased-name indexes."""
+        self._invalidate_caches()
+        self._by_id.pop(presentation["id"], None)
+        self._name_lower.pop(presentation["id"], None)
+        self._tags_lower.pop(presentation["id"], None)
+        lname = presentation["name"].lower()
+        if self._by_lname.get(lname) is presentation:
+            del self._by_lname[lname]
+
     def _validate_presentation(self, presentation: Dict) -> bool:
         """Validate presentation data structure and references."""
         try:
-            valid = (
-                isinstance(presentation, dict) and
-                "id" in presentation and isinstance(presentation["id"], str) and
-                "name" in presentation and isinstance(presentation["name"], str) and presentation["name"].strip() and
-                "slides" in presentation and isinstance(presentation["slides"], list) and
-                all(isinstance(slide, list) and len(slide) == 2 and
-                    isinstance(slide[0], str) and slide[0] in ["Text", "Image", "Video"] and
-                    isinstance(slide[1], str) for slide in presentation["slides"]) and
-                "theme" in presentation and isinstance(presentation["theme"], str) and
-                "tags" in presentation and isinstance(presentation["tags"], str) and
-                "created_at" in presentation and isinstance(presentation["created_at"], str) and
-                "updated_at" in presentation and isinstance(presentation["updated_at"], str)
-            )
-            if not valid:
+            if not isinstance(presentation, dict):
+                return False
+            for field, field_type in _PRESENTATION_FIELD_TYPES:
+                if not isinstance(presentation.get(field), field_type):
+                    return False
+            if not presentation["name"].strip():
                 return False
+            for slide in presentation["slides"]:
+                if not (isinstance(slide, list) and len(slide) == 2 and
+                        isinstance(slide[0], str) and slide[0] in _SLIDE_TYPES and isinstance(slide[1], str)):
+                    return False
 
-            # Validate media paths and theme
+            # Validate media paths and theme; the media model answers from its folder listing
             if self.media_model:
-                media_dir = self.settings_manager.get_setting("paths", "media", "data/media")
                 for slide_type, content in presentation["slides"]:
-                    if slide_type in ["Image", "Video"]:
-                        if not os.path.exists(os.path.join(media_dir, content)):
+                    if slide_type in _MEDIA_SLIDE_TYPES:
+                        if not self.media_model.media_file_exists(content):
                             logger.warning(f"Invalid media path in presentation {presentation['name']}: {content}")
                             return False
             if self.theme_model:
@@ -115,14 +195,16 @@ class PresentationModel:
     def get_all_presentations(self) -> List[Dict]:
         """Return all presentations sorted by name."""
         try:
-            return sorted(self.presentations, key=lambda p: p["name"].lower())
+            if self._sorted_cache is None:
+                self._sorted_cache = sorted(self.presentations, key=lambda p: self._name_lower[p["id"]])
+            return list(self._sorted_cache)
         except Exception as e:
             raise SanctifyError("PresentationModel", "GET_ALL_001", f"Error retrieving presentations: {e}")
 
     def get_presentation_by_id(self, presentation_id: str) -> Optional[Dict]:
         """Retrieve a presentation by its ID."""
         try:
-            return next((p for p in self.presentations if p["id"] == presentation_id), None)
+            return self._by_id.get(presentation_id)
         except Exception as e:
             raise SanctifyError("PresentationModel", "GET_BY_ID_001", f"Error retrieving presentation by ID {presentation_id}: {e}")
 
@@ -132,25 +214,30 @@ class PresentationModel:
             query = query.lower().strip()
             tag = tag.lower().strip()
             results = []
-            for presentation in self.presentations:
-                matches_query = query in presentation["name"].lower() or any(query in t.lower() for t in presentation.get("tags", "").split(","))
-                matches_tag = not tag or tag in presentation.get("tags", "").lower()
-                if matches_query and matches_tag:
+            # Filtering the memoized listing keeps the results in name order without another sort
+            for presentation in self.get_all_presentations():
+                presentation_id = presentation["id"]
+                tags_lower = self._tags_lower[presentation_id]
+                if tag and tag not in tags_lower:
+                    continue
+                if query in self._name_lower[presentation_id] or any(query in t for t in tags_lower):
                     results.append(presentation)
-            return sorted(results, key=lambda p: p["name"].lower())
+            return results
         except Exception as e:
             raise SanctifyError("PresentationModel", "SEARCH_001", f"Error searching presentations with query {query}: {e}")
 
     def get_all_tags(self) -> List[str]:
         """Return a sorted list of unique tags."""
         try:
-            tags = set()
-            for presentation in self.presentations:
-                for tag in presentation.get("tags", "").split(","):
-                    tag = tag.strip()
-                    if tag:
-                        tags.add(tag)
-            return sorted(tags)
+            if self._tags_cache is None:
+                tags = set()
+                for presentation in self.presentations:
+                    for tag in presentation.get("tags", "").split(","):
+                        tag = tag.strip()
+                        if tag:
+                            tags.add(tag)
+                self._tags_cache = sorted(tags)
+            return list(self._tags_cache)
         except Exception as e:
             raise SanctifyError("PresentationModel", "GET_TAGS_001", f"Error retrieving tags: {e}")
 
@@ -159,24 +246,26 @@ class PresentationModel:
         try:
             if not name.strip():
                 raise SanctifyError("PresentationModel", "CREATE_001", "Presentation name is required")
-            if any(p["name"].lower() == name.lower() for p in self.presentations):
+            if name.lower() in self._by_lname:
                 raise SanctifyError("PresentationModel", "CREATE_002", f"Presentation already exists: {name}")
 
+            now = datetime.now().isoformat()
             presentation = {
                 "id": str(uuid.uuid4()),
                 "name": name,
                 "theme": theme,
                 "slides": slides or [],
                 "tags": tags.strip(),
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
+                "created_at": now,
+                "updated_at": now
             }
 
             if not self._validate_presentation(presentation):
                 raise SanctifyError("PresentationModel", "CREATE_003", f"Invalid presentation data for {name}")
 
             self.presentations.append(presentation)
-            self._save_presentations()
+            self._index(presentation)
+            self._schedule_save()
             logger.info(f"Created presentation: {name}")
             return presentation
         except SanctifyError as e:
@@ -192,7 +281,7 @@ class PresentationModel:
                 raise SanctifyError("PresentationModel", "UPDATE_001", f"Presentation not found: {presentation_id}")
 
             if updated_data.get("name", "").strip() and updated_data["name"].lower() != presentation["name"].lower():
-                if any(p["name"].lower() == updated_data["name"].lower() for p in self.presentations if p["id"] != presentation_id):
+                if updated_data["name"].lower() in self._by_lname:
                     raise SanctifyError("PresentationModel", "UPDATE_002", f"Presentation name already exists: {updated_data['name']}")
 
             updated_presentation = presentation.copy()
@@ -210,9 +299,12 @@ class PresentationModel:
             if not self._validate_presentation(updated_presentation):
                 raise SanctifyError("PresentationModel", "UPDATE_003", f"Invalid updated presentation data for {updated_presentation['name']}")
 
-            self.presentations.remove(presentation)
-            self.presentations.append(updated_presentation)
-            self._save_presentations()
+            # Update the stored record in place, so its list slot and existing references stay valid
+            self._unindex(presentation)
+            presentation.clear()
+            presentation.update(updated_presentation)
+            self._index(presentation)
+            self._schedule_save()
             logger.info(f"Updated presentation: {updated_presentation['name']}")
             return True
         except SanctifyError as e:
@@ -227,7 +319,8 @@ class PresentationModel:
             if not presentation:
                 raise SanctifyError("PresentationModel", "DELETE_001", f"Presentation not found: {presentation_id}")
             self.presentations.remove(presentation)
-            self._save_presentations()
+            self._unindex(presentation)
+            self._schedule_save()
             logger.info(f"Deleted presentation: {presentation['name']}")
             return True
         except SanctifyError as e:
@@ -245,14 +338,16 @@ class PresentationModel:
             new_presentation = presentation.copy()
             new_presentation["id"] = str(uuid.uuid4())
             new_presentation["name"] = f"{presentation['name']} (Copy)"
-            new_presentation["created_at"] = datetime.now().isoformat()
-            new_presentation["updated_at"] = new_presentation["created_at"]
+            now = datetime.now().isoformat()
+            new_presentation["created_at"] = now
+            new_presentation["updated_at"] = now
 
-            if any(p["name"].lower() == new_presentation["name"].lower() for p in self.presentations):
+            if new_presentation["name"].lower() in self._by_lname:
                 raise SanctifyError("PresentationModel", "DUPLICATE_002", f"Duplicate presentation name already exists: {new_presentation['name']}")
 
             self.presentations.append(new_presentation)
-            self._save_presentations()
+            self._index(new_presentation)
+            self._schedule_save()
             logger.info(f"Duplicated presentation: {new_presentation['name']}")
             return new_presentation
         except SanctifyError as e:
@@ -264,6 +359,7 @@ class PresentationModel:
         """Import a presentation from PPTX (placeholder)."""
         try:
             name = os.path.splitext(os.path.basename(ppt_path))[0]
+            now = datetime.now().isoformat()
             presentation = {
                 "id": str(uuid.uuid4()),
                 "name": name,
@@ -273,13 +369,14 @@ class PresentationModel:
                     ["Text", "Slide 2: More content..."]
                 ],
                 "tags": "imported,pptx",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
+                "created_at": now,
+                "updated_at": now
             }
             if not self._validate_presentation(presentation):
                 raise SanctifyError("PresentationModel", "IMPORT_001", f"Invalid imported presentation data for {name}")
             self.presentations.append(presentation)
-            self._save_presentations()
+            self._index(presentation)
+            self._schedule_save()
             logger.info(f"Imported presentation: {name}")
             return presentation
         except SanctifyError as e:
@@ -1,9 +1,12 @@
 import os
-import json
+import bisect
 import logging
-from typing import List, Dict, Optional
+import itertools
+from typing import List, Dict, Optional, Set, Tuple
 from core.settings_manager import SettingsManager
 from core.exceptions import SanctifyError
+from core import json_io
+from core.file_cache import file_signature, load_cache, write_cache
 
 # Setup logging
 logging.basicConfig(
@@ -16,12 +19,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Names of indexed bible files with the [size, mtime_ns] they had, so startup can list bibles unparsed;
+# kept in the configuration directory
+BIBLE_INDEX_NAME = '.bible_index.json'
+
 class ScriptureModel:
+    # Parsed bibles kept in memory at once; the least recently used is dropped beyond this
+    MAX_LOADED_BIBLES = 3
+
     def __init__(self, settings_manager: SettingsManager):
         """Initialize ScriptureModel with SettingsManager."""
         self.settings_manager = settings_manager
         self.bible_root = self.settings_manager.get_setting("paths", "bibles", "data/bibles")
+        self._index_file = self.settings_manager.config_path(BIBLE_INDEX_NAME)
+        # Parsed bibles in least-recently-used order, loaded on first access
         self.bibles: Dict[str, Dict] = {}
+        # Every available bible's file and display name, known without parsing it
+        self._bible_files: Dict[str, str] = {}
+        self._bible_names: Dict[str, str] = {}
+        # Per bible: verses flattened in result order as (book, chapter, verse, text), their
+        # casefolded texts as one NUL-separated UTF-8 buffer with each verse's start offset, and
+        # an index from each casefolded word to the positions of the verses containing it.
+        # Built on the first search of a bible.
+        self._search_data: Dict[str, Tuple[List[Tuple[str, int, int, str]], bytes, List[int], Dict[str, List[int]]]] = {}
+        # Per bible: lowercased book name -> chapter number -> chapter, built on first lookup
+        self._chapters_by_book: Dict[str, Dict[str, Dict[int, Dict]]] = {}
         try:
             self._load_bibles()
         except Exception as e:
@@ -38,71 +60,122 @@ class ScriptureModel:
             raise SanctifyError("ScriptureModel", "DIR_001", f"Error creating bibles directory: {e}")
 
     def _load_bibles(self) -> None:
-        """Load all available bibles from the bibles directory."""
+        """List the available bibles, parsing only files the bible index has not seen unchanged."""
         self._ensure_directories()
         self.bibles.clear()
+        self._bible_files.clear()
+        self._bible_names.clear()
+        self._search_data.clear()
+        self._chapters_by_book.clear()
+        bible_index = load_cache(self._index_file)
+        new_index: Dict[str, Dict] = {}
         try:
             for file in os.listdir(self.bible_root):
                 if file.endswith('.json'):
                     file_path = os.path.join(self.bible_root, file)
+                    bible_id = os.path.splitext(file)[0]
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            bible_data = json.load(f)
-                            if self._validate_bible(bible_data):
-                                bible_id = os.path.splitext(file)[0]
-                                self.bibles[bible_id] = bible_data
-                                logger.debug(f"Loaded bible: {bible_id}")
-                            else:
+                        signature = file_signature(file_path)
+                        entry = bible_index.get(file_path)
+                        if isinstance(entry, dict) and entry.get("signature") == signature and isinstance(entry.get("name"), str):
+                            name = entry["name"]
+                        else:
+                            bible_data = json_io.load_file(file_path)
+                            if not self._validate_bible(bible_data):
                                 logger.warning(f"Invalid bible data: {file}")
-                    except json.JSONDecodeError as e:
+                                continue
+                            name = bible_data["name"]
+                            # Already parsed, so keep it rather than reading it again on first use
+                            self._cache_bible(bible_id, bible_data)
+                            logger.debug(f"Loaded bible: {bible_id}")
+                        self._bible_files[bible_id] = file_path
+                        self._bible_names[bible_id] = name
+                        new_index[file_path] = {"signature": signature, "name": name}
+                    except json_io.JSONDecodeError as e:
                         raise SanctifyError("ScriptureModel", "LOAD_002", f"Error decoding JSON from {file_path}: {e}")
                     except Exception as e:
                         raise SanctifyError("ScriptureModel", "LOAD_003", f"Error loading bible from {file_path}: {e}")
-            if not self.bibles:
+            if not self._bible_files:
                 logger.warning(f"No valid bibles found in {self.bible_root}")
         except Exception as e:
             raise SanctifyError("ScriptureModel", "LOAD_001", f"Error scanning bibles directory {self.bible_root}: {e}")
+        if new_index != bible_index:
+            try:
+                write_cache(self._index_file, new_index)
+            except OSError as e:
+                logger.warning(f"Failed to write bible index: {e}")
+
+    def _cache_bible(self, bible_id: str, bible_data: Dict) -> None:
+        """Keep a parsed bible as the most recently used, dropping the least recently used over the limit."""
+        self.bibles.pop(bible_id, None)
+        self.bibles[bible_id] = bible_data
+        while len(self.bibles) > self.MAX_LOADED_BIBLES:
+            evicted = next(iter(self.bibles))
+            del self.bibles[evicted]
+            self._drop_lookups(evicted)
+
+    def _drop_lookups(self, bible_id: str) -> None:
+        """Discard the search data and chapter lookup built from a bible."""
+        self._search_data.pop(bible_id, None)
+        self._chapters_by_book.pop(bible_id, None)
 
     def _validate_bible(self, bible: Dict) -> bool:
         """Validate bible data structure."""
         try:
-            return (
-                isinstance(bible, dict) and
-                "name" in bible and isinstance(bible["name"], str) and bible["name"].strip() and
-                "books" in bible and isinstance(bible["books"], list) and
-                all(
-                    isinstance(book, dict) and
-                    "name" in book and isinstance(book["name"], str) and book["name"].strip() and
-                    "chapters" in book and isinstance(book["chapters"], list) and
-                    all(
-                        isinstance(chapter, dict) and
-                        "chapter" in chapter and isinstance(chapter["chapter"], int) and chapter["chapter"] > 0 and
-                        "verses" in chapter and isinstance(chapter["verses"], list) and
-                        all(
-                            isinstance(verse, dict) and
-                            "verse" in verse and isinstance(verse["verse"], int) and verse["verse"] > 0 and
-                            "text" in verse and isinstance(verse["text"], str) and verse["text"].strip()
-                            for verse in chapter["verses"]
-                        )
-                        for chapter in book["chapters"]
-                    )
-                    for book in bible["books"]
-                )
-            )
+            # Plain loops that return at the first bad record, rather than nested all() generators
+            if not (isinstance(bible, dict) and isinstance(bible.get("name"), str) and bible["name"].strip()):
+                return False
+            books = bible.get("books")
+            if not isinstance(books, list):
+                return False
+            for book in books:
+                if not (isinstance(book, dict) and isinstance(book.get("name"), str) and book["name"].strip()):
+                    return False
+                chapters = book.get("chapters")
+                if not isinstance(chapters, list):
+                    return False
+                for chapter in chapters:
+                    if not isinstance(chapter, dict):
+                        return False
+                    number = chapter.get("chapter")
+                    verses = chapter.get("verses")
+                    if not (isinstance(number, int) and number > 0 and isinstance(verses, list)):
+                        return False
+                    for verse in verses:
+                        if not isinstance(verse, dict):
+                            return False
+                        number = verse.get("verse")
+                        text = verse.get("text")
+                        if not (isinstance(number, int) and number > 0 and isinstance(text, str) and text.strip()):
+                            return False
+            return True
         except Exception as e:
             raise SanctifyError("ScriptureModel", "VALIDATE_001", f"Error validating bible: {e}")
 
     def get_all_bibles(self) -> List[Dict]:
         """Return a list of all loaded bibles."""
         try:
-            return sorted([{"id": k, "name": v["name"]} for k, v in self.bibles.items()], key=lambda x: x["name"].lower())
+            return sorted([{"id": k, "name": v} for k, v in self._bible_names.items()], key=lambda x: x["name"].lower())
         except Exception as e:
             raise SanctifyError("ScriptureModel", "GET_ALL_001", f"Error retrieving bibles: {e}")
 
     def get_bible_by_id(self, bible_id: str) -> Optional[Dict]:
-        """Retrieve a bible by its ID."""
+        """Retrieve a bible by its ID, parsing its file on first access."""
         try:
-            return self.bibles.get(bible_id)
+            bible = self.bibles.get(bible_id)
+            if bible is not None:
+                self._cache_bible(bible_id, bible)
+                return bible
+            file_path = self._bible_files.get(bible_id)
+            if file_path is None:
+                return None
+            bible = json_io.load_file(file_path)
+            if not self._validate_bible(bible):
+                logger.warning(f"Invalid bible data: {file_path}")
+                return None
+            self._cache_bible(bible_id, bible)
+            logger.debug(f"Loaded bible: {bible_id}")
+            return bible
         except Exception as e:
             raise SanctifyError("ScriptureModel", "GET_BY_ID_001", f"Error retrieving bible by ID {bible_id}: {e}")
 
@@ -118,16 +191,32 @@ class ScriptureModel:
         except Exception as e:
             raise SanctifyError("ScriptureModel", "GET_BOOKS_002", f"Error retrieving books for bible {bible_id}: {e}")
 
+    def _get_chapters_by_book(self, bible_id: str, bible: Dict) -> Dict[str, Dict[int, Dict]]:
+        """Return a bible's chapters keyed by lowercased book name and chapter number, building them on first use."""
+        chapters_by_book = self._chapters_by_book.get(bible_id)
+        if chapters_by_book is None:
+            chapters_by_book = {}
+            for book in bible["books"]:
+                # The first book or chapter of a repeated name or number wins, as the scans did
+                book_name = book["name"].lower()
+                if book_name not in chapters_by_book:
+                    chapters: Dict[int, Dict] = {}
+                    for chapter in book["chapters"]:
+                        chapters.setdefault(chapter["chapter"], chapter)
+                    chapters_by_book[book_name] = chapters
+            self._chapters_by_book[bible_id] = chapters_by_book
+        return chapters_by_book
+
     def get_chapters(self, bible_id: str, book_name: str) -> List[int]:
         """Return a list of chapter numbers for a specific book."""
         try:
             bible = self.get_bible_by_id(bible_id)
             if not bible:
                 raise SanctifyError("ScriptureModel", "GET_CHAPTERS_001", f"Bible not found: {bible_id}")
-            book = next((b for b in bible["books"] if b["name"].lower() == book_name.lower()), None)
-            if not book:
+            chapters = self._get_chapters_by_book(bible_id, bible).get(book_name.lower())
+            if chapters is None:
                 raise SanctifyError("ScriptureModel", "GET_CHAPTERS_002", f"Book not found: {book_name}")
-            return sorted([chapter["chapter"] for chapter in book["chapters"]])
+            return sorted(chapters)
         except SanctifyError as e:
             raise e
         except Exception as e:
@@ -139,10 +228,10 @@ class ScriptureModel:
             bible = self.get_bible_by_id(bible_id)
             if not bible:
                 raise SanctifyError("ScriptureModel", "GET_VERSES_001", f"Bible not found: {bible_id}")
-            book = next((b for b in bible["books"] if b["name"].lower() == book_name.lower()), None)
-            if not book:
+            chapters = self._get_chapters_by_book(bible_id, bible).get(book_name.lower())
+            if chapters is None:
                 raise SanctifyError("ScriptureModel", "GET_VERSES_002", f"Book not found: {book_name}")
-            chapter = next((c for c in book["chapters"] if c["chapter"] == chapter_number), None)
+            chapter = chapters.get(chapter_number)
             if not chapter:
                 raise SanctifyError("ScriptureModel", "GET_VERSES_003", f"Chapter not found: {chapter_number}")
             return sorted(chapter["verses"], key=lambda x: x["verse"])
@@ -151,25 +240,94 @@ class ScriptureModel:
         except Exception as e:
             raise SanctifyError("ScriptureModel", "GET_VERSES_004", f"Error retrieving verses for {book_name} chapter {chapter_number} in bible {bible_id}: {e}")
 
+    def _get_search_data(self, bible_id: str) -> Tuple[List[Tuple[str, int, int, str]], bytes, List[int], Dict[str, List[int]]]:
+        """Return the flattened verses, folded text buffer, offsets and word index of a bible, building them on first use."""
+        data = self._search_data.get(bible_id)
+        if data is None:
+            verses = [
+                (book["name"], chapter["chapter"], verse["verse"], verse["text"])
+                for book in self.bibles[bible_id]["books"]
+                for chapter in book["chapters"]
+                for verse in chapter["verses"]
+            ]
+            # Sorted into result order once, so matches collected by ascending position need no sort
+            verses.sort(key=lambda x: (x[0].lower(), x[1], x[2]))
+            folded = [verse[3].casefold() for verse in verses]
+            word_index: Dict[str, List[int]] = {}
+            for position, text in enumerate(folded):
+                for word in set(text.split()):
+                    word_index.setdefault(word, []).append(position)
+            encoded = [text.encode('utf-8') for text in folded]
+            # offsets[i] is where verse i starts; the final entry is the buffer length
+            offsets = list(itertools.accumulate((len(text) + 1 for text in encoded), initial=0))
+            blob = b"\0".join(encoded) + b"\0"
+            data = self._search_data[bible_id] = (verses, blob, offsets, word_index)
+        return data
+
+    @staticmethod
+    def _candidate_positions(word_index: Dict[str, List[int]], query: str) -> Set[int]:
+        """Return the positions of verses whose words could contain the casefolded query.
+
+        A match of a multi-word query lines up its inner words with whole verse words; only the
+        first word may be cut at its start and the last at its end, so those are matched as a
+        suffix and a prefix against the index vocabulary.
+        """
+        words = query.split()
+        last = len(words) - 1
+        postings = []
+        for i, word in enumerate(words):
+            if 0 < i < last:
+                positions = set(word_index.get(word, ()))
+            else:
+                if i == 0:
+                    matching = [p for w, p in word_index.items() if w.endswith(word)]
+                else:
+                    matching = [p for w, p in word_index.items() if w.startswith(word)]
+                positions = set().union(*matching)
+            if not positions:
+                return set()
+            postings.append(positions)
+        # Intersect starting from the rarest word
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+
     def search_verses(self, bible_id: str, query: str) -> List[Dict]:
         """Search verses containing the query string."""
         try:
             bible = self.get_bible_by_id(bible_id)
             if not bible:
                 raise SanctifyError("ScriptureModel", "SEARCH_001", f"Bible not found: {bible_id}")
-            query = query.lower().strip()
+            # casefold also matches caseless forms lower() misses, such as "ß" and "ss"
+            query = query.casefold().strip()
+            verses, blob, offsets, word_index = self._get_search_data(bible_id)
+            encoded_query = query.encode('utf-8')
+            if not query:
+                positions = range(len(verses))
+            elif len(query.split()) == 1:
+                # A single word can match inside any verse word, so scan the whole buffer with
+                # bytes.find and map each hit to its verse, resuming at the next verse
+                positions = []
+                start = blob.find(encoded_query)
+                while start != -1:
+                    position = bisect.bisect_right(offsets, start) - 1
+                    positions.append(position)
+                    start = blob.find(encoded_query, offsets[position + 1])
+            else:
+                # Candidates come from whole words, so each is confirmed against its own verse text
+                positions = [
+                    position for position in sorted(self._candidate_positions(word_index, query))
+                    if blob.find(encoded_query, offsets[position], offsets[position + 1] - 1) != -1
+                ]
             results = []
-            for book in bible["books"]:
-                for chapter in book["chapters"]:
-                    for verse in chapter["verses"]:
-                        if query in verse["text"].lower():
-                            results.append({
-                                "book": book["name"],
-                                "chapter": chapter["chapter"],
-                                "verse": verse["verse"],
-                                "text": verse["text"]
-                            })
-            return sorted(results, key=lambda x: (x["book"].lower(), x["chapter"], x["verse"]))
+            for position in positions:
+                book, chapter, verse, text = verses[position]
+                results.append({
+                    "book": book,
+                    "chapter": chapter,
+                    "verse": verse,
+                    "text": text
+                })
+            return results
         except SanctifyError as e:
             raise e
         except Exception as e:
@@ -178,15 +336,18 @@ class ScriptureModel:
     def add_bible(self, bible_data: Dict, bible_id: str) -> bool:
         """Add a new bible to the collection."""
         try:
-            if bible_id in self.bibles:
+            if bible_id in self._bible_files:
                 raise SanctifyError("ScriptureModel", "ADD_001", f"Bible already exists: {bible_id}")
             if not self._validate_bible(bible_data):
                 raise SanctifyError("ScriptureModel", "ADD_002", f"Invalid bible data for {bible_data.get('name', 'Unknown')}")
             file_path = os.path.join(self.bible_root, f"{bible_id}.json")
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(bible_data, f, indent=4, ensure_ascii=False)
-                self.bibles[bible_id] = bible_data
+                with open(file_path, 'wb') as f:
+                    f.write(json_io.dumps(bible_data))
+                self._bible_files[bible_id] = file_path
+                self._bible_names[bible_id] = bible_data["name"]
+                self._drop_lookups(bible_id)
+                self._cache_bible(bible_id, bible_data)
                 logger.info(f"Added bible: {bible_id}")
                 return True
             except Exception as e:
@@ -199,13 +360,15 @@ class ScriptureModel:
     def delete_bible(self, bible_id: str) -> bool:
         """Delete a bible from the collection."""
         try:
-            bible = self.get_bible_by_id(bible_id)
-            if not bible:
+            file_path = self._bible_files.get(bible_id)
+            if file_path is None:
                 raise SanctifyError("ScriptureModel", "DELETE_001", f"Bible not found: {bible_id}")
-            file_path = os.path.join(self.bible_root, f"{bible_id}.json")
             try:
                 os.remove(file_path)
-                del self.bibles[bible_id]
+                del self._bible_files[bible_id]
+                del self._bible_names[bible_id]
+                self.bibles.pop(bible_id, None)
+                self._drop_lookups(bible_id)
                 logger.info(f"Deleted bible: {bible_id}")
                 return True
             except Exception as e:
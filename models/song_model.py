@@ -34,7 +34,7 @@ class SongModel:
             raise SanctifyError("SongModel", "PATH_001", f"Invalid songs path type: {type(songs_path)}, expected string")
 
         self.songs.clear()
-        if os.path.exists(songs_path):
+        if self.settings_manager.path_exists(songs_path):
             try:
                 with open(songs_path, 'r', encoding='utf-8') as f:
                     loaded_songs = json.load(f)
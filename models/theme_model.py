@@ -18,6 +18,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Text style used wherever content is shown without a selected theme
+DEFAULT_THEME = {
+    "font_color": "#ecf0f1",
+    "background_color": "#2c3e50",
+    "font_size": "18",
+    "font_family": "Arial",
+    "alignment": "center",
+}
+
 class ThemeModel:
     def __init__(self, settings_manager: SettingsManager):
         """Initialize ThemeModel with SettingsManager."""
@@ -44,7 +53,7 @@ class ThemeModel:
         """Load theme metadata from JSON file."""
         theme_file = self.settings_manager.get_setting("paths", "themes", "data/themes/themes.json")
         self.themes.clear()
-        if os.path.exists(theme_file):
+        if self.settings_manager.path_exists(theme_file):
             try:
                 with open(theme_file, 'r', encoding='utf-8') as f:
                     loaded_themes = json.load(f)
@@ -2,7 +2,7 @@ import os
 import json
 import logging
 import traceback
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTabWidget,
     QSplitter, QFrame, QLabel, QStatusBar, QMenuBar, QAction, QMenu,
@@ -13,6 +13,7 @@ from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtGui import QIcon, QFont, QPixmap, QPalette, QColor
 from PyQt5.QtWidgets import QApplication
 from core.settings_manager import SettingsManager
+from models.theme_model import DEFAULT_THEME
 from ui.songs_ui import SongsTab
 from ui.scriptures_ui import ScripturesTab
 from ui.media_ui import MediaTab
@@ -35,10 +36,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Appended to the application stylesheet when accessibility.high_contrast is on
+HIGH_CONTRAST_QSS = """
+    QWidget {
+        background: #000000;
+        color: #ffffff;
+    }
+    QPushButton {
+        border: 2px solid #ffffff;
+        background: #000000;
+        color: #ffffff;
+    }
+"""
+
 class SanctifyApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, settings_manager: Optional[SettingsManager] = None):
         super().__init__()
-        self.settings_manager = SettingsManager()  # Initialize SettingsManager
+        # Share the application's SettingsManager so there is one debounced writer to flush on exit
+        self.settings_manager = settings_manager or SettingsManager()
         self.setWindowTitle("Sanctify Live")
         self.setMinimumSize(1280, 720)
         self.setObjectName("SanctifyMainWindow")  # For accessibility
@@ -233,6 +248,8 @@ class SanctifyApp(QMainWindow):
             """ % (font.family(), font.pointSize())
             if theme == "Dark":
                 stylesheet = stylesheet.replace("#ecf0f1", "#2c3e50").replace("#2c3e50", "#ecf0f1").replace("#dfe6e9", "#34495e")
+            if self.settings_manager.get_setting("accessibility", "high_contrast", False):
+                stylesheet += HIGH_CONTRAST_QSS
             QApplication.instance().setStyleSheet(stylesheet)
             QApplication.instance().setFont(font)
             self.preview_canvas.apply_theme()
@@ -624,15 +641,15 @@ class SanctifyApp(QMainWindow):
             logger.error("Failed to toggle white screen: %s", traceback.format_exc())
             self.status_bar.showMessage(f"White screen error: {str(e)}")
 
+    def _current_theme(self) -> Dict[str, Any]:
+        """Return the selected theme as resolved by the themes tab, or the default style."""
+        return self.themes_tab.current_theme or DEFAULT_THEME
+
     def go_live(self):
         """Send selected content to live output with theme."""
         try:
             current_tab = self.tabs.currentWidget()
-            theme_item = self.themes_tab.theme_list.currentItem()
-            theme_data = theme_item.data(Qt.UserRole) if theme_item else {
-                "font_color": "#ecf0f1", "background_color": "#2c3e50",
-                "font_size": "18", "font_family": "Arial", "alignment": "center"
-            }
+            theme_data = self._current_theme()
             content = None
             content_type = "text"
             content_id = None
@@ -697,11 +714,7 @@ class SanctifyApp(QMainWindow):
         """Automatically preview selected content."""
         try:
             current_tab = self.tabs.currentWidget()
-            theme_item = self.themes_tab.theme_list.currentItem()
-            theme_data = theme_item.data(Qt.UserRole) if theme_item else {
-                "font_color": "#ecf0f1", "background_color": "#2c3e50",
-                "font_size": "18", "font_family": "Arial", "alignment": "center"
-            }
+            theme_data = self._current_theme()
             content = None
             content_type = "text"
 
@@ -860,11 +873,7 @@ class SanctifyApp(QMainWindow):
                 logger.error("Schedule item missing type or id: %s", data)
                 self.status_bar.showMessage("Invalid schedule item")
                 return
-            theme_item = self.themes_tab.theme_list.currentItem()
-            theme_data = theme_item.data(Qt.UserRole) if theme_item else {
-                "font_color": "#ecf0f1", "background_color": "#2c3e50",
-                "font_size": "18", "font_family": "Arial", "alignment": "center"
-            }
+            theme_data = self._current_theme()
             content = None
             content_title = None
             if content_type == "song":
@@ -1071,6 +1080,11 @@ class SanctifyApp(QMainWindow):
         """Handle window close event."""
         try:
             self.save_window_state()
+            self.settings_manager.flush()
+            # Write presentation edits still waiting on the model's debounced save
+            presentation_model = getattr(self.presentation_tab, "presentation_model", None)
+            if hasattr(presentation_model, "flush"):
+                presentation_model.flush()
             event.accept()
         except Exception as e:
             logger.error("Failed to handle close event: %s", traceback.format_exc())
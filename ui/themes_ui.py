@@ -9,7 +9,7 @@ from PyQt5.QtWidgets import (
     QPushButton, QLabel, QComboBox, QSplitter, QFrame, QMessageBox, QDialog,
     QTextEdit, QFontComboBox, QSpinBox, QColorDialog, QCompleter, QInputDialog, QApplication
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QColor
 from PyQt5.QtWidgets import QListWidget
 from PyQt5.QtGui import QIcon
@@ -402,9 +402,12 @@ class ThemeEditor(QDialog):
             QMessageBox.warning(self, "Error", msg)
 
 class ThemesTab(QWidget):
+    theme_changed = pyqtSignal(object)  # resolved theme dict, or None when nothing is selected
+
     def __init__(self):
         super().__init__()
         self.theme_model = ThemeModel()
+        self.current_theme = None
         self.search_history = []
         self.search_results = []
 
@@ -583,6 +586,7 @@ class ThemesTab(QWidget):
             }
         """)
         self.theme_list.itemClicked.connect(self.update_preview)
+        self.theme_list.currentItemChanged.connect(self._on_current_item_changed)
         self.theme_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.theme_list.customContextMenuRequested.connect(self.open_context_menu)
         self.theme_list.keyPressEvent = self.handle_list_keypress
@@ -671,6 +675,11 @@ class ThemesTab(QWidget):
         """Load all themes into the list."""
         self.perform_search()
 
+    def _on_current_item_changed(self, current: QListWidgetItem, previous: QListWidgetItem):
+        """Resolve the newly selected theme once and notify listeners."""
+        self.current_theme = self.theme_model.get_theme_by_id(current.data(Qt.UserRole)) if current else None
+        self.theme_changed.emit(self.current_theme)
+
     def update_preview(self, item: QListWidgetItem):
         """Update the preview with the selected theme."""
         theme_id = item.data(Qt.UserRole)